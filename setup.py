@@ -1,35 +1,48 @@
-from setuptools import setup, find_packages
-from tmanager import __name__, __version__, __description__, __url__
+from setuptools import setup
+
+# Read the package metadata without importing the tmanager package
+about = {}
+with open("tmanager/_version.py", "r") as f:
+    exec(f.read(), about)
 
 with open("README.md", "r") as f:
     long_description = f.read()
 
 setup(
-    name=__name__,
-    version=__version__,
-    url=__url__,
+    name=about["__name__"],
+    version=about["__version__"],
+    url=about["__url__"],
     license="MIT",
-    description=__description__,
+    description=about["__description__"],
     long_description=long_description,
     long_description_content_type="text/markdown",
     author="ssh3ll",
     author_email="ssh3ll at protonmail.com",
     maintainer="Valerio Preti",
     maintainer_email="valerio.preti.tman at gmail.com",
-    packages=find_packages(),
+    packages=[
+        "tmanager",
+        "tmanager.commands",
+        "tmanager.core",
+        "tmanager.core.config",
+        "tmanager.core.messages",
+        "tmanager.core.tool",
+        "tmanager.core.tool.localfile",
+        "tmanager.core.tool.repository",
+        "tmanager.utilities",
+    ],
     include_package_data=True,
     install_requires=[
         "click>=7.0",
         "GitPython>=2.1.11",
         "python-crontab>=2.3.6",
     ],
-    setup_requires=[
-        "pytest-runner>=4.4",
-    ],
-    tests_require=[
-        "pytest>=4.4",
-    ],
-    python_requires=">=2.7,!=3.0.*,!=3.1.*,!=3.2.*,!=3.3.*",
+    extras_require={
+        "test": [
+            "pytest>=4.4",
+        ],
+    },
+    python_requires=">=3.8",
     entry_points={
         "console_scripts": [
             "tman = tmanager.tman:tman",
@@ -1,4 +1,19 @@
+import inspect
+from click.testing import CliRunner
+
 NO_SUCH_OPTION_ERROR_TEMPLATE = "Error: no such option: {}"
 NO_SUCH_COMMAND_ERROR_TEMPLATE = "Error: No such command \"{}\""
 
 MISSING_COMMAND_ERROR_TEMPLATE = "Error: Missing command."
+
+
+def new_runner() -> CliRunner:
+    """
+    Return a CliRunner that keeps stderr apart from stdout, so that tests can assert on result.stderr.
+    Click 8.2+ always does, older versions need mix_stderr=False.
+
+    :return CliRunner: runner
+    """
+    if "mix_stderr" in inspect.signature(CliRunner).parameters:
+        return CliRunner(mix_stderr=False)
+    return CliRunner()
@@ -0,0 +1,8 @@
+import pytest
+
+
+@pytest.mark.parametrize("cmd", ["config", "export-conf", "find", "import-conf", "install", "scan"])
+def test_tman_command_help(runner, tman_cmd, cmd):
+    result = runner.invoke(tman_cmd, [cmd, "--help"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert result.stderr == ""
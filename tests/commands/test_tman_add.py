@@ -1,9 +1,4 @@
-from click.testing import CliRunner
-from tmanager.tman import tman
-
-runner = CliRunner()
-
-
-def test_tman_add_help():
-    result = runner.invoke(tman, ["add", "--help"])
+def test_tman_add_help(runner, tman_cmd):
+    result = runner.invoke(tman_cmd, ["add", "--help"], catch_exceptions=False)
     assert result.exit_code == 0
+    assert result.stderr == ""
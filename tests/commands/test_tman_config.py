@@ -1,9 +1,59 @@
-from click.testing import CliRunner
-from tmanager.tman import tman
+import click
+import pytest
+from tmanager.commands.config import _cron_job_field_proc, _cron_job_fields
 
-runner = CliRunner()
+# Field name -> (min, max)
+_ranges = {param: (min_value, max_value) for param, _, min_value, max_value in _cron_job_fields}
 
 
-def test_tman_config_help():
-    result = runner.invoke(tman, ["config", "--help"])
-    assert result.exit_code == 0
+def _proc(param):
+    return _cron_job_field_proc(param, *_ranges[param])
+
+
+@pytest.mark.parametrize("param, value, expected", [
+    ("minute", "*", "*"),
+    ("minute", "0", "0"),
+    ("minute", "59", "59"),
+    ("minute", "0,15, 30 ,45", "0,15,30,45"),
+    ("hour", "0", "0"),
+    ("hour", "23", "23"),
+    ("hour", "8,20", "8,20"),
+    ("day of month", "1", "1"),
+    ("day of month", "31", "31"),
+    ("month", "1", "1"),
+    ("month", "12", "12"),
+    ("month", "*", "*"),
+    ("day of week", "0", "0"),
+    ("day of week", "6", "6"),
+    ("day of week", "0,6", "0,6"),
+])
+def test_cron_job_field_valid(param, value, expected):
+    assert _proc(param)(value) == expected
+
+
+@pytest.mark.parametrize("param, value", [
+    ("minute", "60"),
+    ("minute", "-1"),
+    ("minute", "*/5"),
+    ("minute", "1-5"),
+    ("minute", "1,,2"),
+    ("minute", "1,"),
+    ("minute", ""),
+    ("minute", "a"),
+    ("hour", "24"),
+    ("hour", "1,24"),
+    ("day of month", "0"),
+    ("day of month", "32"),
+    ("month", "0"),
+    ("month", "13"),
+    ("month", "*/2"),
+    ("day of week", "7"),
+    ("day of week", "**"),
+    # int() would take them, cron wouldn't
+    ("minute", "+5"),
+    ("minute", "-0"),
+    ("minute", "1_0"),
+])
+def test_cron_job_field_invalid(param, value):
+    with pytest.raises(click.BadParameter):
+        _proc(param)(value)
@@ -1,9 +1,4 @@
-from click.testing import CliRunner
-from tmanager.tman import tman
-
-runner = CliRunner()
-
-
-def test_tman_delete_help():
-    result = runner.invoke(tman, ["delete", "--help"])
+def test_tman_delete_help(runner, tman_cmd):
+    result = runner.invoke(tman_cmd, ["delete", "--help"], catch_exceptions=False)
     assert result.exit_code == 0
+    assert result.stderr == ""
@@ -0,0 +1,13 @@
+import pytest
+from tests import new_runner
+
+
+@pytest.fixture(scope="session")
+def runner():
+    return new_runner()
+
+
+@pytest.fixture(scope="session")
+def tman_cmd():
+    from tmanager.tman import tman
+    return tman
@@ -0,0 +1,105 @@
+import json
+import os
+import pytest
+from tmanager.core.config.config import Config
+from tmanager.core.tool.localfile.localfile import LocalFile
+from tmanager.core.tool.repository.repository import Repository
+
+
+@pytest.fixture
+def opt(tmp_path):
+    # Directories of the managed tools
+    for d in ("alpha", "alpha/sub", "alphabet", "beta"):
+        (tmp_path / "opt" / d).mkdir(parents=True)
+    return str(tmp_path / "opt")
+
+
+@pytest.fixture
+def cfg(tmp_path, monkeypatch, opt):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / ".tman").mkdir()
+    tools = [
+        LocalFile(os.path.join(opt, "alpha")).to_dict(),
+        Repository("https://github.com/x/beta", opt).to_dict(),
+    ]
+    # Written as tman itself writes it
+    with open(str(tmp_path / ".tman" / "config.json"), "w") as f:
+        json.dump({"default_installation_directory": opt, "automatic_install": False, "tools": tools}, f,
+                  separators=(",", ":"))
+
+    c = Config()
+    c.load()
+    return c
+
+
+def _names(tools):
+    return sorted(t.get_name() for t in tools)
+
+
+def _assert_indexes(cfg):
+    tools = cfg["tools"]
+    assert cfg._by_name == {t["name"]: t for t in tools}
+    assert cfg._by_directory == {t["directory"]: t for t in tools}
+    for _type in ("git", "local"):
+        assert cfg._sorted_dirs.get(_type, []) == sorted(t["directory"] for t in tools if t["type"] == _type)
+
+
+def test_get_tools_under_prefix_boundary(cfg, opt):
+    # /opt/alpha is not under /opt/alph, nor is /opt/alphabet under /opt/alpha
+    assert cfg.get_tools_under(os.path.join(opt, "alph")) == []
+    assert _names(cfg.get_tools_under(os.path.join(opt, "alpha"))) == ["alpha"]
+    assert _names(cfg.get_tools_under(os.path.join(opt, "alpha") + "/")) == ["alpha"]
+    assert _names(cfg.get_tools_under(opt)) == ["alpha", "beta"]
+    assert _names(cfg.get_tools_under(opt, "git")) == ["beta"]
+
+
+def test_already_managed(cfg, opt):
+    assert cfg.already_managed(LocalFile(os.path.join(opt, "alpha", "sub")))
+    assert not cfg.already_managed(LocalFile(os.path.join(opt, "alphabet")))
+    assert cfg.already_managed(Repository("https://github.com/y/beta", "/elsewhere"))
+
+
+def test_indexes_after_add_update_remove(cfg, opt):
+    _assert_indexes(cfg)
+
+    gamma = Repository("https://github.com/x/gamma", opt)
+    cfg.add_tool(gamma)
+    _assert_indexes(cfg)
+    assert cfg.get_tool("gamma") == gamma
+
+    # Updating keeps the tool position, and indexes its new directory
+    gamma.set_directory(os.path.join(opt, "new") + "/")
+    gamma.set_tags(["t1"])
+    cfg.update_tool(gamma)
+    _assert_indexes(cfg)
+    assert [t["name"] for t in cfg["tools"]] == ["alpha", "beta", "gamma"]
+    assert cfg.get_tool("gamma").get_tags() == ["t1"]
+    assert _names(cfg.get_tools_under(os.path.join(opt, "new"))) == ["gamma"]
+
+    cfg.remove_tool(cfg.get_tool("beta"))
+    _assert_indexes(cfg)
+    assert cfg.get_tool("beta") is None
+
+    removed = cfg.remove_tools([cfg.get_tool("alpha"), cfg.get_tool("gamma")])
+    _assert_indexes(cfg)
+    assert _names(removed) == ["alpha", "gamma"]
+    assert cfg["tools"] == []
+
+
+def test_save_skips_unchanged_configuration(cfg):
+    # Move the modification time to the past, any write would update it
+    os.utime(cfg.config_file, ns=(0, 0))
+    cfg.save()
+    assert os.stat(cfg.config_file).st_mtime_ns == 0
+
+    cfg.set_automatic_install(True)
+    cfg.save()
+    assert os.stat(cfg.config_file).st_mtime_ns != 0
+
+    with open(cfg.config_file) as f:
+        assert json.load(f)["automatic_install"] is True
+
+    # Nothing changed since the last write
+    os.utime(cfg.config_file, ns=(0, 0))
+    cfg.save()
+    assert os.stat(cfg.config_file).st_mtime_ns == 0
@@ -0,0 +1,78 @@
+import pytest
+import tmanager.utilities.commands as utl_cmds
+from tmanager.core.tool.repository.repository import Repository
+
+
+@pytest.fixture
+def tools():
+    return [Repository("https://github.com/x/foo", "/opt"), Repository("https://github.com/x/foobar", "/opt")]
+
+
+def _names(tools):
+    return [t.get_name() for t in tools]
+
+
+@pytest.mark.parametrize("name, f, expected", [
+    ("foo", False, ["foo"]),
+    ("fo", False, []),
+    ("FOO", False, []),
+    (("foo",), True, ["foo", "foobar"]),
+    (("BAR",), True, ["foobar"]),
+    (("nope",), True, []),
+])
+def test_find_tool_name(tools, name, f, expected):
+    assert _names(utl_cmds.find_tool(None, name=name, f=f, tools=tools)) == expected
+
+
+@pytest.mark.parametrize("url, f, expected", [
+    ("https://github.com/x/foo", False, ["foo"]),
+    ("https://github.com/x/foo.git", False, ["foo"]),
+    ("https://github.com/x/foo/", False, ["foo"]),
+    ("https://github.com/x/fo", False, []),
+    ("https://github.com/x/foo", True, ["foo", "foobar"]),
+    ("GITHUB.COM/X/FOOB", True, ["foobar"]),
+])
+def test_find_tool_url(tools, url, f, expected):
+    assert _names(utl_cmds.find_tool(None, url=url, f=f, tools=tools)) == expected
+
+
+@pytest.mark.parametrize("user_input, expected", [
+    ("1", [0]),
+    ("3,1,2", [0, 1, 2]),
+    (" 2 , 1 ", [0, 1]),
+    ("2,2,1,2", [0, 1]),
+    ("0", []),
+    ("0,1", [0]),
+    ("3,4", [2]),
+    ("-1", []),
+    ("1-3", []),
+    ("1 3", []),
+    ("1a,b,", []),
+    ("", []),
+])
+def test_sanitize_indexes(user_input, expected):
+    assert utl_cmds.sanitize_indexes(["a", "b", "c"], user_input) == expected
+
+
+@pytest.mark.parametrize("tags", [
+    ["t1", "t2"],
+    ["my-tag", "-", "a--b"],
+    ["it's", 'say"hi"'],
+    ["a]b", "[c]"],
+    [],
+])
+def test_remove_tags_export_round_trip(tags):
+    from tmanager.commands.export_conf import _skipped_properties
+    from tmanager.commands.import_conf import _property_re
+
+    tool = Repository("https://github.com/my-org/my-tool", "/opt/my-dir", tags=tags)
+
+    # Tool row, as export-conf writes it
+    row = ",".join("{}-{}".format(k, v) for k, v in tool.to_dict().items() if k not in _skipped_properties)
+
+    line, found_tags = utl_cmds.remove_tags(row)
+    assert found_tags == tags
+
+    properties = dict(_property_re.findall(line))
+    assert properties == {"name": "my-tool", "url": "https://github.com/my-org/my-tool.git", "type": "git",
+                          "directory": "/opt/my-dir/my-tool"}
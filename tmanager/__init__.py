@@ -1,5 +1,3 @@
-__name__ = "tool-manager"
-__name_desc__ = "Tool Manager"
-__version__ = "1.0.0"
-__description__ = "tman, a simple tool manager"
-__url__ = "https://github.com/ssh3ll/tmanager"
+from tmanager._version import __name__, __name_desc__, __version__, __description__, __url__
+
+__all__ = ["__name__", "__name_desc__", "__version__", "__description__", "__url__"]
@@ -0,0 +1,5 @@
+__name__ = "tool-manager"
+__name_desc__ = "Tool Manager"
+__version__ = "1.0.0"
+__description__ = "tman, a simple tool manager"
+__url__ = "https://github.com/ssh3ll/tmanager"
@@ -1,4 +1,6 @@
+import csv
 import os
+import stat
 import sys
 import click
 import time
@@ -7,13 +9,16 @@ import tmanager.utilities.commands as utl_cmds
 import tmanager.utilities.file_system as utl_fs
 
 from srblib import abs_path
+from tmanager.core.config.config import Config
+from tmanager.core.tool.tool import Tool
 from tmanager.core.tool.repository.repository import Repository
 from tmanager.core.tool.localfile.localfile import LocalFile
-from tmanager.core.tool.tool import Tool
-from tmanager.core.config.config import Config
 
 CMD_NAME = "add"
 
+# Maximum number of repositories cloned at the same time when adding tools from file
+_MAX_CLONE_WORKERS = 16
+
 
 @click.command()
 @click.argument("tool", required=False, metavar="[repo_url|local_pathname]")
@@ -54,12 +59,13 @@ def add(ctx: click.core.Context, tool: str, tags: str, install_dir: str, in_file
     cfg = utl_cmds.get_configs_from_context(ctx)
 
     # Add tools from CSV
-    imported_tools = 0
     if in_file:
         tools = parse_tools_from_csv(in_file, cfg.get_default_installation_directory(), assume_yes, log_fname)
-        for t in tools:
-            if add_tool(cfg, t, log_fname) == 0:
-                imported_tools += 1
+        clone_results = _clone_new_repositories(cfg, tools) if cfg.get_automatic_install() else {}
+        # Add the tools in input order, with the outcome of their clone (if any)
+        results = [add_tool(cfg, t, log_fname, defer_save=True, clone_res=clone_results.get(id(t))) for t in tools]
+        imported_tools = results.count(0)
+        cfg.save()
         msg.Prints.info("Successfully imported {}/{} tools".format(imported_tools, len(tools)), log_fname,
                         CMD_NAME, icon=False)
 
@@ -98,8 +104,8 @@ def add(ctx: click.core.Context, tool: str, tags: str, install_dir: str, in_file
             # Get the absolute pathname
             tool_path = os.path.abspath(tool_path)
 
-            dst = directory + utl_fs.get_file_name(tool_path) if directory != default_dir else \
-                default_dir + utl_fs.get_file_name(tool_path)
+            tool_name = utl_fs.get_file_name(tool_path)
+            dst = os.path.join(directory, tool_name)
 
             # If the destination directory is provided by user
             if tool_path != directory and install_dir is not None:
@@ -110,7 +116,7 @@ def add(ctx: click.core.Context, tool: str, tags: str, install_dir: str, in_file
                         sys.exit(1)
 
                 # If the tools is not managed yet, then move file
-                if not cfg.has_tool(utl_fs.get_file_name(tool_path)):
+                if not cfg.has_tool(tool_name):
                     if os.path.isdir(tool_path):
                         utl_fs.delete_from_fs(dst)
                         utl_fs.move_file(tool_path, dst)
@@ -118,12 +124,9 @@ def add(ctx: click.core.Context, tool: str, tags: str, install_dir: str, in_file
                         # Move the tool
                         utl_fs.move_file(tool_path, dst)
 
-                    # Add trailing slash if requires
-                    tool_path = utl_fs.trailing_slash(tool_path)
-                    tool_path = directory + tool_path.split("/")[-1]
-                    tool = LocalFile(tool_path, tags=tags, add_date=time.time())
+                    tool = LocalFile(dst, tags=tags, add_date=time.time())
                 else:
-                    msg.Prints.info("tool {} is already managed!!!".format(utl_fs.get_file_name(tool_path)),
+                    msg.Prints.info("tool {} is already managed!!!".format(tool_name),
                                     log_fname, CMD_NAME)
                     tool = None
             else:
@@ -164,6 +167,31 @@ def add(ctx: click.core.Context, tool: str, tags: str, install_dir: str, in_file
     sys.exit(0)
 
 
+def _clone_new_repositories(cfg: Config, tools: list) -> dict:
+    """
+    Clone in parallel the repositories that add_tool would clone: those that are not managed yet.
+    Only the first of several tools with the same name or directory gets cloned, add_tool will find the others
+    already managed.
+
+    :param Config cfg: tman configuration object
+    :param list tools: tools to be added
+    :return dict: clone() status code by id() of the cloned tool
+    """
+    names = set()
+    directories = set()
+    to_clone = []
+    for tool in tools:
+        if not tool.is_git_repo() or cfg.already_managed(tool):
+            continue
+        if tool.get_name() in names or tool.get_directory() in directories:
+            continue
+        names.add(tool.get_name())
+        directories.add(tool.get_directory())
+        to_clone.append(tool)
+
+    return {id(t): res for t, res in zip(to_clone, Repository.clone_many(to_clone, _MAX_CLONE_WORKERS))}
+
+
 def parse_tools_from_csv(repositories_file: str, default_install_dir: str, assume_yes: bool, log_fname: str) -> list:
     """
     Parses the input file and returns a list containing the read tools
@@ -180,81 +208,90 @@ def parse_tools_from_csv(repositories_file: str, default_install_dir: str, assum
     :param str log_fname: log filename
     :return list: repositories list
     """
-    # Raise an exception if the provided file does not exist or it's not readable
-    if not os.path.exists(repositories_file) or not os.path.isfile(repositories_file):
+    # Raise an exception if the provided file does not exist or it's not a regular file
+    try:
+        is_file = stat.S_ISREG(os.stat(repositories_file).st_mode)
+    except OSError:
+        is_file = False
+
+    if not is_file:
         raise click.ClickException(msg.Echoes.error("File {} doesn't exist. Please provide a valid path"
                                                     .format(repositories_file)))
 
     tools = []
-    # Read the file lines
-    with open(repositories_file, "r") as f:
-        lines = f.readlines()
-
-    for line in lines:
-        line = line.strip()
-
-        # Ignore empty strings
-        res = list(filter(None, line.split(",")))
-        if len(res) == 0:
-            continue
-
-        # Retrieve tool's properties
-        url = res[0]
-
-        # Get tags
-        tags = []
-        for t in res[1:]:
-            if not t.startswith("d="):
-                tags.append(t)
-
-        tags = utl_cmds.sanitize_tags(tags)
-
-        # Get destination directory
-        directory = default_install_dir
-        if res[-1].startswith("d="):
-            directory = abs_path(res[-1].split("=")[1])
-            directory = utl_fs.trailing_slash(directory)
-
-        dst_dir = directory + utl_fs.get_file_name(url)
-
-        # Instantiate a Tool object, depending on it's kind
-        tool = None
-        if utl_cmds.is_git_url(url):
-            tool = Repository(url, directory, tags=tags, add_date=time.time())
-        else:
-            tool_path = url
-            # If tool_path != directory, then move the local tool
-            if tool_path != dst_dir:
-                if not os.path.exists(tool_path):
-                    msg.Prints.info("[*] cannot add {}, pathname does not exist.".format(tool_path), log_fname,
-                                    CMD_NAME, icon=False)
-                    continue
-                if os.path.exists(dst_dir):
-                    msg.Prints.info("{} exists, what to do???".format(dst_dir), log_fname, CMD_NAME, icon=False)
-
-                    # If assume_yes is set, do not prompt anything and overwrite
-                    # If assume_yes is not set, then ask for confirmation
-                    if assume_yes or click.confirm(msg.Echoes.input("Overwrite '{}'??".format(dst_dir))):
-                        msg.Prints.info("Moving {} into {}".format(tool_path, dst_dir), log_fname, CMD_NAME, icon=False)
-                        utl_fs.delete_from_fs(dst_dir)
-                        utl_fs.move_file(tool_path, dst_dir)
-                        tool = LocalFile(dst_dir, tags=tags, add_date=time.time())
+    # Absolute pathnames of the d= directories, rows often share the same one
+    abs_dirs = {}
+    # Every tool of the same import shares the same add date
+    add_date = time.time()
+
+    # Read the file row by row
+    with open(repositories_file, "r", newline="") as f:
+        for row in csv.reader(f, skipinitialspace=True):
+            # Strip every field, then ignore the empty ones
+            res = [c for c in (c.strip() for c in row) if c]
+            if len(res) == 0:
+                continue
+
+            # Retrieve tool's properties
+            url = res[0]
+
+            # Get tags
+            tags = []
+            for t in res[1:]:
+                if not t.startswith("d="):
+                    tags.append(t)
+
+            tags = utl_cmds.sanitize_tags(tags)
+
+            # Get destination directory
+            directory = default_install_dir
+            if res[-1].startswith("d="):
+                directory = res[-1].split("=", 1)[1]
+                if directory not in abs_dirs:
+                    abs_dirs[directory] = abs_path(directory)
+                directory = abs_dirs[directory]
+
+            dst_dir = os.path.join(directory, utl_fs.get_file_name(url))
+
+            # Instantiate a Tool object, depending on it's kind
+            tool = None
+            if utl_cmds.is_git_url(url):
+                tool = Repository(url, directory, tags=tags, add_date=add_date)
+            else:
+                tool_path = url
+                # If tool_path != directory, then move the local tool
+                if tool_path != dst_dir:
+                    if not os.path.exists(tool_path):
+                        msg.Prints.info("[*] cannot add {}, pathname does not exist.".format(tool_path), log_fname,
+                                        CMD_NAME, icon=False)
+                        continue
+                    if os.path.exists(dst_dir):
+                        msg.Prints.info("{} exists, what to do???".format(dst_dir), log_fname, CMD_NAME, icon=False)
+
+                        # If assume_yes is set, do not prompt anything and overwrite
+                        # If assume_yes is not set, then ask for confirmation
+                        if assume_yes or click.confirm(msg.Echoes.input("Overwrite '{}'??".format(dst_dir))):
+                            msg.Prints.info("Moving {} into {}".format(tool_path, dst_dir), log_fname, CMD_NAME,
+                                            icon=False)
+                            utl_fs.delete_from_fs(dst_dir)
+                            utl_fs.move_file(tool_path, dst_dir)
+                            tool = LocalFile(dst_dir, tags=tags, add_date=add_date)
+                        else:
+                            tool = None
+
+                    # Move the file/dir if it doesn't exist!
                     else:
-                        tool = None
-
-                # Move the file/dir if it doesn't exist!
-                else:
-                    # Move the tool
-                    utl_fs.move_file(tool_path, dst_dir)
-                    tool = LocalFile(tool_path, tags=tags, add_date=time.time())
+                        # Move the tool
+                        utl_fs.move_file(tool_path, dst_dir)
+                        tool = LocalFile(dst_dir, tags=tags, add_date=add_date)
 
-        if tool is not None:
-            tools.append(tool)
+            if tool is not None:
+                tools.append(tool)
 
     return tools
 
 
-def add_tool(cfg: Config, tool: Tool, log_fname: str) -> int:
+def add_tool(cfg: Config, tool: Tool, log_fname: str, defer_save: bool = False, clone_res: int = None) -> int:
     """
     Add a tool in tman configurations, if automatic_install is set
     then the tool is installed too
@@ -272,25 +309,29 @@ def add_tool(cfg: Config, tool: Tool, log_fname: str) -> int:
     :param Tool tool: repository Repository
     :param Config cfg: configuration Config
     :param str log_fname: log filename
+    :param bool defer_save: do not save the configuration file, the caller will do it
+    :param int clone_res: clone() status code when the repository has already been cloned by the caller
     :return int: status code
     """
     tools_to_delete = []
+    tool_name = tool.get_name()
+    tool_dir = tool.get_directory()
 
     # If it is a local file
     if tool.is_localfile():
         # Make sure the tool exists
-        if not os.path.exists(tool.get_directory()):
+        try:
+            tool_mode = os.stat(tool_dir).st_mode
+        except OSError:
             return 5
+
         # check if it's a directory
-        elif os.path.isdir(tool.get_directory()):
+        if stat.S_ISDIR(tool_mode):
             # check if there's any child repository already managed by tman
-            for repo in cfg.get_tools(repo_only=True):
-                if repo.get_directory().startswith(tool.get_directory()):
-                    return 6
+            if cfg.get_tools_under(tool_dir, "git"):
+                return 6
             # otherwise remove any local file that is also managed by tman (already)
-            for t in cfg.get_tools():
-                if t.is_localfile() and t.get_directory().startswith(tool.get_directory()):
-                    tools_to_delete.append(t)
+            tools_to_delete = cfg.get_tools_under(tool_dir, "local")
 
     # Check if the tool is already managed
     if cfg.already_managed(tool):
@@ -301,17 +342,17 @@ def add_tool(cfg: Config, tool: Tool, log_fname: str) -> int:
 
     # If automatic_install is set, then try to clone the repository
     if cfg.get_automatic_install() and tool.is_git_repo():
-        res = tool.clone()
+        res = tool.clone() if clone_res is None else clone_res
         # If everything is okay, then add the defined new tool into the .config file
         if res == 0:
-            tool.set_install_date(time.time())
-            tool.set_last_update_date(time.time())
+            tool.update_timestamps()
 
             # Add the repository only if clone
             cfg.add_tool(tool)
-            cfg.save()
+            if not defer_save:
+                cfg.save()
             msg.Prints.success("Repository '{}' cloned successfully into {}"
-                               .format(tool.get_name(), tool.get_directory()), log_fname, CMD_NAME)
+                               .format(tool_name, tool_dir), log_fname, CMD_NAME)
 
             return 0
 
@@ -323,5 +364,6 @@ def add_tool(cfg: Config, tool: Tool, log_fname: str) -> int:
             return 2
     else:
         cfg.add_tool(tool)
-        cfg.save()
+        if not defer_save:
+            cfg.save()
         return 0
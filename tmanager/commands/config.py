@@ -1,20 +1,33 @@
 import click
+import functools
 import os
+import re
 import sys
-import shutil
+import typing
 import tmanager.core.messages.messages as msg
 import tmanager.utilities.commands as utl_cmds
-import tmanager.utilities.file_system as utl_fs
 from tmanager.core.config.config import Config
-from crontab import CronTab, CronItem
-from srblib import abs_path
 
-_available_automatic_install_true_arguments = ["true", "on", "yes"]
-_available_automatic_install_false_arguments = ["false", "off", "no"]
-_available_automatic_install_arguments = _available_automatic_install_true_arguments + \
+# python-crontab is only needed by --cron-job: import it for type checking only, see the cron helpers
+if typing.TYPE_CHECKING:
+    from crontab import CronTab, CronItem
+
+_available_automatic_install_true_arguments = frozenset({"true", "on", "yes"})
+_available_automatic_install_false_arguments = frozenset({"false", "off", "no"})
+_available_automatic_install_arguments = _available_automatic_install_true_arguments | \
                                          _available_automatic_install_false_arguments
-_available_cron_job_arguments = ["create", "update", "delete", "enable", "disable", "status"]
-_which_tmanager = shutil.which("tman")
+_available_cron_job_arguments = frozenset({"create", "update", "delete", "enable", "disable", "status"})
+# Tman cron job command and comment
+_cron_job_command = "{tman} update --all -y -l {log}"
+_cron_job_comment = "Tman cron job"
+# Cron job fields, other than *, must be a comma separated list of numbers
+_cron_job_field_re = re.compile(r" *[0-9]+ *(?:, *[0-9]+ *)*")
+# Cron job fields name, prompt and range, in cron tab order
+_cron_job_fields = (("minute", "minute (0 - 59)", 0, 59),
+                    ("hour", "hour (0 - 23)", 0, 23),
+                    ("day of month", "day of the month (1 - 31)", 1, 31),
+                    ("month", "month (1 - 12)", 1, 12),
+                    ("day of week", "day of the week (0 - 6) (Sunday to Saturday)", 0, 6))
 
 CMD_NAME = "config"
 
@@ -38,6 +51,24 @@ def config(ctx: click.core.Context, default_dir: str, auto_install: str, cron_jo
     :param str log: log filename
     :return: None
     """
+    # Get configurations and verbose
+    cfg = utl_cmds.get_configs_from_context(ctx)
+    vrb = utl_cmds.get_verbose_from_context(ctx)
+
+    # Check that just one option has been selected...
+    msg.Prints.verbose("Check that only one option has been selected", vrb)
+
+    options_count = sum(1 for option in (default_dir, auto_install, cron_job) if option)
+    if options_count > 1:
+        utl_cmds.usage_error(CMD_NAME)
+        sys.exit(1)
+
+    # If no option is specified, then print current config. settings: it's read-only, no further check is needed
+    if options_count == 0:
+        print("auto-install: {}".format(cfg.get_automatic_install()))
+        print("default-dir : {}".format(cfg.get_default_installation_directory()))
+        return
+
     # if a filename for logs is provided, then make sure it exists and it's writable.
     log_fname = ""
     if log:
@@ -45,10 +76,6 @@ def config(ctx: click.core.Context, default_dir: str, auto_install: str, cron_jo
         if not log_fname:
             sys.exit(1)
 
-    # Get configurations and verbose
-    cfg = utl_cmds.get_configs_from_context(ctx)
-    vrb = utl_cmds.get_verbose_from_context(ctx)
-
     # Check if user is root and ask confirmation to continue, if so
     msg.Prints.verbose("Check user role", vrb)
 
@@ -60,15 +87,6 @@ def config(ctx: click.core.Context, default_dir: str, auto_install: str, cron_jo
         else:
             sys.exit(1)
 
-    # Check that just one option has been selected...
-    msg.Prints.verbose("Check that only one option has been selected", vrb)
-
-    # If no option is specified, then print current config. settings
-    if not ((bool(default_dir) != bool(auto_install)) != bool(cron_job)):
-        print("auto-install: {}".format(cfg.get_automatic_install()))
-        print("default-dir : {}".format(cfg.get_default_installation_directory()))
-        sys.exit(0)
-
     # DEFAULT INSTALLATION DIRECTORY
     if default_dir:
         _set_new_default_dir(default_dir, cfg, vrb)
@@ -82,7 +100,9 @@ def config(ctx: click.core.Context, default_dir: str, auto_install: str, cron_jo
         msg.Prints.verbose("Cron job configuration selected", vrb)
         msg.Prints.verbose("Checking argument {}".format(cron_job), vrb)
 
-        if _check_cron_argument(cron_job):
+        if cron_job in _available_cron_job_arguments:
+            from crontab import CronTab
+
             # Create cron
             cron = CronTab(user=True)
 
@@ -101,31 +121,10 @@ def config(ctx: click.core.Context, default_dir: str, auto_install: str, cron_jo
                 _cron_job_enable_disable(cron_job, cron, vrb)
 
         else:
-            msg.Prints.error("You have to choose one among {} arguments".format(str(_available_cron_job_arguments)))
+            msg.Prints.error("You have to choose one among {} arguments"
+                             .format(str(sorted(_available_cron_job_arguments))))
             sys.exit(1)
 
-    sys.exit(0)
-
-
-def _check_automatic_install_argument(argument: str) -> bool:
-    """
-    Check if --automatic-install argument is fine.
-
-    :param str argument: --automatic-install argument
-    :return bool: True if the argument is valid, False otherwise
-    """
-    return argument in _available_automatic_install_arguments
-
-
-def _check_cron_argument(argument: str) -> bool:
-    """
-    Check if --cron-job argument is fine.
-
-    :param str argument: --cron-job argument
-    :return bool: True id the argument is valid, False otherwise
-    """
-    return argument in _available_cron_job_arguments
-
 
 def _cron_job_check(value: str, min_value: int, max_value: int) -> bool:
     """
@@ -140,19 +139,14 @@ def _cron_job_check(value: str, min_value: int, max_value: int) -> bool:
     if value == "*":
         return True
 
+    if not _cron_job_field_re.fullmatch(value):
+        return False
+
     # value may be composed of several arguments separated by a ","
-    value = value.split(",")
-    for v in value:
-        try:
-            v = int(v)
-            if not min_value <= v <= max_value:
-                return False
-        except ValueError:
-            return False
-    return True
+    return all(min_value <= int(v) <= max_value for v in value.split(","))
 
 
-def _cron_job_create_update(cfg: Config, cron_job: str, cron: CronTab, vrb: bool):
+def _cron_job_create_update(cfg: Config, cron_job: str, cron: "CronTab", vrb: bool):
     """
     Create or update tman cron job
 
@@ -165,12 +159,10 @@ def _cron_job_create_update(cfg: Config, cron_job: str, cron: CronTab, vrb: bool
     msg.Prints.verbose("Cron job {} selected".format(cron_job), vrb)
     msg.Prints.verbose("Check if a tman cron job does already exist", vrb)
 
-    cron_list = _get_cron_list(cron)
+    job = _find_cron_job(cron)
 
     update_cron = None
-    if cron_list:
-        job = _get_job_from_cron_list(cron_list)
-
+    if job is not None:
         if cron_job == "create":
             msg.Prints.warning("A tman job does already exist")
 
@@ -184,7 +176,7 @@ def _cron_job_create_update(cfg: Config, cron_job: str, cron: CronTab, vrb: bool
             msg.Prints.warning("@@@ Update aborted by {}".format(utl_cmds.get_user_login()))
             raise click.Abort()
 
-    elif not cron_list and cron_job == "update":
+    elif cron_job == "update":
         msg.Prints.warning("No cron job to update found.")
         create_cron_job = click.confirm(msg.Echoes.input("Do you want to create a new cron job"), default=True)
 
@@ -206,23 +198,23 @@ def _cron_job_create_update(cfg: Config, cron_job: str, cron: CronTab, vrb: bool
     #       - dow = day of week
     mnt, hrs, dom, mth, dow, log_fname = _get_cron_job_data(cfg)
 
-    # cron job comment
-    cmt = "Tman cron job"
-    cmd = "{} update --all -y -l {}".format(_which_tmanager, log_fname)
+    cmd = _cron_job_command.format(tman=_tman_path(), log=log_fname)
 
     msg.Prints.verbose("Creating cron job", vrb)
 
     # Create job
-    job = cron.new(command=cmd, comment=cmt)
+    job = cron.new(command=cmd, comment=_cron_job_comment)
 
     msg.Prints.verbose("Cron job created", vrb)
     msg.Prints.verbose("Scheduling cron job according to user input", vrb)
 
     # Set cron job schedule
-    job_schedule = "{} {} {} {} {}".format(mnt, hrs, dom, mth, dow)
+    job_schedule = " ".join((mnt, hrs, dom, mth, dow))
     job.setall(job_schedule)
 
-    msg.Prints.verbose("Cron job scheduled {}".format(job), vrb)
+    # Rendering a cron job isn't free: do it only when verbose
+    if vrb:
+        msg.Prints.verbose("Cron job scheduled {}".format(job), vrb)
 
     # Check if cron job is valid
     msg.Prints.verbose("Checking job validity", vrb)
@@ -243,7 +235,7 @@ def _cron_job_create_update(cfg: Config, cron_job: str, cron: CronTab, vrb: bool
         raise click.Abort()
 
 
-def _cron_job_delete(cron: CronTab, vrb: bool) -> None:
+def _cron_job_delete(cron: "CronTab", vrb: bool) -> None:
     """
     Delete tman cron job.
 
@@ -255,10 +247,10 @@ def _cron_job_delete(cron: CronTab, vrb: bool) -> None:
     msg.Prints.verbose("Looking for cron job", vrb)
 
     # Find cron job
-    cron_list = _get_cron_list(cron)
-    job = _get_job_from_cron_list(cron_list)
+    job = _get_cron_job(cron)
 
-    msg.Prints.verbose("Cron job found: {}".format(job), vrb)
+    if vrb:
+        msg.Prints.verbose("Cron job found: {}".format(job), vrb)
     msg.Prints.verbose("Attempting to remove it", vrb)
 
     # Delete job
@@ -268,7 +260,7 @@ def _cron_job_delete(cron: CronTab, vrb: bool) -> None:
     cron.write()
 
 
-def _cron_job_enable_disable(cron_job: str, cron: CronTab, vrb: bool) -> None:
+def _cron_job_enable_disable(cron_job: str, cron: "CronTab", vrb: bool) -> None:
     """
     Enable or disable tman cron job.
 
@@ -281,16 +273,16 @@ def _cron_job_enable_disable(cron_job: str, cron: CronTab, vrb: bool) -> None:
     msg.Prints.verbose("Looking for cron job", vrb)
 
     # Find cron job
-    cron_list = _get_cron_list(cron)
-    job = _get_job_from_cron_list(cron_list)
+    job = _get_cron_job(cron)
 
-    msg.Prints.verbose("Cron job found: {}".format(job), vrb)
+    if vrb:
+        msg.Prints.verbose("Cron job found: {}".format(job), vrb)
 
     # Enable cron job
     _enable_cron_job(cron, job, True if cron_job == "enable" else False)
 
 
-def _cron_job_status(cron: CronTab, vrb: bool) -> None:
+def _cron_job_status(cron: "CronTab", vrb: bool) -> None:
     """
     Check tman cron job status.
 
@@ -302,8 +294,7 @@ def _cron_job_status(cron: CronTab, vrb: bool) -> None:
     msg.Prints.verbose("Looking for cron job", vrb)
 
     # Find cron job
-    cron_list = _get_cron_list(cron)
-    job = _get_job_from_cron_list(cron_list)
+    job = _get_cron_job(cron)
 
     # Check cron status
     msg.Prints.success("Cron job found: {}".format(job))
@@ -334,7 +325,7 @@ def _cron_job_wizard() -> None:
     msg.Prints.info("@@@ Leave it blank to * the info")
 
 
-def _enable_cron_job(cron: CronTab, job: CronItem, enable: bool = True) -> None:
+def _enable_cron_job(cron: "CronTab", job: "CronItem", enable: bool = True) -> None:
     """
     Enable/Disable a cron job.
 
@@ -347,6 +338,33 @@ def _enable_cron_job(cron: CronTab, job: CronItem, enable: bool = True) -> None:
     cron.write()
 
 
+def _cron_job_field_proc(param: str, min_value: int, max_value: int) -> typing.Callable[[str], str]:
+    """
+    Return the click.prompt value_proc of a cron job field.
+
+    :param str param: field name
+    :param int min_value: min range value
+    :param int max_value: max range value
+    :return Callable: function that validates the field and removes its spaces, they would break the cron job
+    """
+    def proc(value: str) -> str:
+        if not _cron_job_check(value, min_value, max_value):
+            _raise_cron_input_data_exception(param, "({} - {})".format(min_value, max_value))
+        return value.replace(" ", "")
+
+    return proc
+
+
+def _find_cron_job(cron: "CronTab") -> typing.Optional["CronItem"]:
+    """
+    Find Tman cron job, stopping at the first match.
+
+    :param CronTab cron: Users cron
+    :return CronItem: tman cron job if found, None otherwise
+    """
+    return next(cron.find_command("tman"), None)
+
+
 def _get_cron_job_data(cfg: Config) -> list:
     """
     Get all cron job required data:
@@ -362,31 +380,13 @@ def _get_cron_job_data(cfg: Config) -> list:
     :return list: validated list of cron job data
     """
     # default log file
-    default_logfile = "{}{}".format(utl_fs.trailing_slash(cfg.config_dir), "tman-cron.log")
-
-    # Get cron job data
-    mnt = click.prompt(msg.Echoes.input("@@@ Insert minute (0 - 59)"), default="*")
-    hrs = click.prompt(msg.Echoes.input("@@@ Insert hour (0 - 23)"), default="*")
-    dom = click.prompt(msg.Echoes.input("@@@ Insert day of the month (1 - 31)"), default="*")
-    mth = click.prompt(msg.Echoes.input("@@@ Insert month (1 - 12)"), default="*")
-    dow = click.prompt(msg.Echoes.input("@@@ Insert day of the week (0 - 6) (Sunday to Saturday)"), default="*")
-    log = click.prompt(msg.Echoes.input("@@@ Enter a file pathname for logging stuffs?"), default=default_logfile)
-
-    # Check data consistency
-    if not _cron_job_check(mnt, 0, 59):
-        _raise_cron_input_data_exception("minute", "(0 - 59)")
+    default_logfile = os.path.join(cfg.config_dir, "tman-cron.log")
 
-    if not _cron_job_check(hrs, 0, 23):
-        _raise_cron_input_data_exception("hour", "(0 - 23)")
-
-    if not _cron_job_check(dom, 1, 31):
-        _raise_cron_input_data_exception("day of month", "(1 - 31)")
-
-    if not _cron_job_check(mth, 1, 12):
-        _raise_cron_input_data_exception("month", "(1 - 12)")
-
-    if not _cron_job_check(dow, 0, 6):
-        _raise_cron_input_data_exception("day of week", "(0 - 6)")
+    # Get cron job data, every field is validated as soon as it's entered and asked again if wrong
+    data = [click.prompt(msg.Echoes.input("@@@ Insert {}".format(prompt)), default="*",
+                         value_proc=_cron_job_field_proc(param, min_value, max_value))
+            for param, prompt, min_value, max_value in _cron_job_fields]
+    log = click.prompt(msg.Echoes.input("@@@ Enter a file pathname for logging stuffs?"), default=default_logfile)
 
     # if a filename for logging has been provided by the user, do the required checks and prompt the user when needed
     if log != default_logfile:
@@ -394,62 +394,24 @@ def _get_cron_job_data(cfg: Config) -> list:
         if not log:
             sys.exit(1)
 
-    # Remove spaces, they will cause error in cron job writing
-    mnt = mnt.replace(" ", "")
-    hrs = hrs.replace(" ", "")
-    dom = dom.replace(" ", "")
-    mth = mth.replace(" ", "")
-    dow = dow.replace(" ", "")
-
-    return [mnt, hrs, dom, mth, dow, log]
+    return data + [log]
 
 
-def _get_cron_list(cron: CronTab) -> list:
+def _get_cron_job(cron: "CronTab") -> "CronItem":
     """
-    Find Tman cron job.
+    Return Tman cron job, if not found raise an exception.
 
     :param CronTab cron: Users cron
-    :return list: tman cron job list
-    """
-    return list(cron.find_command("tman"))
-
-
-def _get_job_from_cron_list(cron_list: list) -> CronItem:
-    """
-    Return CronItem from cron list, if not found raise an exception .
-
-    :param list cron_list: cron job list
     :return CronItem: Job if found, otherwise raise an exception
     """
-    try:
-        job = cron_list[0]
-    except IndexError:
+    job = _find_cron_job(cron)
+    if job is None:
         msg.Prints.error("Cron job not found")
         raise click.Abort()
 
     return job
 
 
-def _is_automatic_install_true(argument: str) -> bool:
-    """
-    Check if --automatic-install argument is True.
-
-    :param str argument: --automatic-install argument
-    :return bool: True if the argument is True, False otherwise
-    """
-    return argument in _available_automatic_install_true_arguments
-
-
-def _is_automatic_install_false(argument: str) -> bool:
-    """
-    Check if --automatic-install argument is False.
-
-    :param str argument: --automatic-install argument
-    :return bool: True if the argument is False, False otherwise
-    """
-    return argument in _available_automatic_install_false_arguments
-
-
 def _raise_automatic_install_exception() -> None:
     """
     Raise click BadOptionUsage for --automatic-install configurations.
@@ -458,7 +420,7 @@ def _raise_automatic_install_exception() -> None:
     """
     raise click.BadOptionUsage("Automatic Install Option Error",
                                msg.Echoes.error("Please select one among the available options: {}"
-                                                .format(str(_available_automatic_install_arguments))))
+                                                .format(str(sorted(_available_automatic_install_arguments)))))
 
 
 def _raise_cron_input_data_exception(param: str, param_hint: str) -> None:
@@ -491,15 +453,11 @@ def _set_new_auto_install(auto_install: str, cfg: Config, vrb: bool) -> None:
 
     msg.Prints.verbose("Check if given input is valid: {}".format(auto_install), vrb)
 
-    if _check_automatic_install_argument(auto_install):
-        if _is_automatic_install_true(auto_install):
-            new_automatic_install = True
-
-        elif _is_automatic_install_false(auto_install):
-            new_automatic_install = False
+    if auto_install in _available_automatic_install_true_arguments:
+        new_automatic_install = True
 
-        else:
-            _raise_automatic_install_exception()
+    elif auto_install in _available_automatic_install_false_arguments:
+        new_automatic_install = False
 
     else:
         _raise_automatic_install_exception()
@@ -520,6 +478,8 @@ def _set_new_default_dir(default_dir: str, cfg: Config, vrb: bool) -> None:
     :param bool vrb: verbose output
     :return: None
     """
+    from srblib import abs_path
+
     # Get the absolute path of new default installation directory
     default_dir = abs_path(default_dir)
 
@@ -538,3 +498,15 @@ def _set_new_default_dir(default_dir: str, cfg: Config, vrb: bool) -> None:
     cfg.set_default_installation_directory(default_dir)
     msg.Prints.success("Default installation directory directory changed in {}".format(default_dir))
     cfg.save()
+
+
+@functools.lru_cache(maxsize=1)
+def _tman_path() -> str:
+    """
+    Return tman executable pathname, looked up in $PATH just once.
+
+    :return str: tman executable pathname
+    """
+    import shutil
+
+    return shutil.which("tman")
@@ -9,7 +9,7 @@ CMD_NAME = "delete"
 
 
 @click.command()
-@click.option("-n", "--name", help="Delete tool by name.", metavar="<tool-name>")
+@click.option("-n", "--name", help="Delete tool by name (exact match).", metavar="<tool-name>")
 @click.option("-i", "--input-file", help="Read tool names from input file.", metavar="<pathname>")
 @click.option("-a", "--all", is_flag=True, help="Delete all tools.")
 @click.option("-l", "--log", help="Log to file instead of printing to stdout.", metavar="<filename>")
@@ -30,7 +30,7 @@ def delete(ctx: click.core.Context, name: str, input_file: str, all: bool, log:
     """
     cfg = utl_cmds.get_configs_from_context(ctx)
     # Make sure that at least one options is set
-    if not (bool(name) ^ bool(input_file) ^ bool(all)):
+    if sum(1 for option in (name, input_file, all) if option) != 1:
         utl_cmds.usage_error("delete")
         sys.exit(1)
 
@@ -52,33 +52,35 @@ def delete(ctx: click.core.Context, name: str, input_file: str, all: bool, log:
         tools_to_delete += utl_cmds.find_tool(cfg, name=name)
 
     elif input_file:
-        # Read tool names from file (one per line)
+        # Read tool names from file (one per line), skipping blank lines and duplicates
         try:
             with open(input_file, "r") as f:
-                for tool_name in f.readlines():
-                    tool_name = tool_name.strip()
+                tool_names = dict.fromkeys(line.strip() for line in f)
+                tool_names.pop("", None)
 
-                    # Retrieve repos by tool_name
-                    tools_to_delete += utl_cmds.find_tool(cfg, name=tool_name)
-
-        except FileNotFoundError:
+        except (FileNotFoundError, PermissionError):
             raise click.BadOptionUsage("--input-file",
                                        "The file {} doesn't exist or it's not readable, try with another one"
                                        .format(input_file))
 
+        # Retrieve tools by name
+        for tool_name in tool_names:
+            tool = cfg.get_tool(tool_name)
+            if tool is not None:
+                tools_to_delete.append(tool)
+
     # Display an info message if there's no repository to delete
     if (bool(all) is False and len(tools_to_delete) == 0) or (bool(all) and len(tools) == 0):
         msg.Prints.warning("No tool to delete", log_fname, CMD_NAME)
         sys.exit(1)
 
     elif bool(all):
-        # Delete every tool
+        # Delete every tool, the configuration file gets saved as soon as they're removed
         _delete_all(cfg, tools, assume_yes, log_fname)
 
     else:
         # Delete the retrieved tools
-        for tool in tools_to_delete:
-            cfg.remove_tool(tool)
+        for tool in cfg.remove_tools(tools_to_delete):
             msg.Prints.success("{} has been removed".format(tool.get_name()), log_fname, CMD_NAME)
 
             # Ensure the user wishes to delete the tools from file system too
@@ -88,8 +90,7 @@ def delete(ctx: click.core.Context, name: str, input_file: str, all: bool, log:
                 msg.Prints.success("{} successfully deleted from file system!".format(tool.get_name()),
                                    log_fname, CMD_NAME)
 
-    cfg.save()
-    sys.exit(0)
+        cfg.save()
 
 
 def _delete_all(cfg: Config, deleted_tools: list, assume_yes: bool, log_fname: str) -> None:
@@ -121,15 +122,16 @@ def _delete_all(cfg: Config, deleted_tools: list, assume_yes: bool, log_fname: s
     if delete_all_file_system:
         for tool in deleted_tools:
             if tool.is_installed():
-                utl_fs.delete_from_fs(tool.get_directory())
-                msg.Prints.info("{} deleted".format(tool.get_directory()), log_fname, CMD_NAME, icon=False)
+                tool_dir = tool.get_directory()
+                utl_fs.delete_from_fs(tool_dir)
+                msg.Prints.info("{} deleted".format(tool_dir), log_fname, CMD_NAME, icon=False)
 
     # Let the user decide which tool he wishes to delete permanently!
     elif deleted_tools and not assume_yes:
         msg.Prints.info("Enter comma-separated list of indexes to remove (i.e. 1,3,4)", log_fname, CMD_NAME)
 
-        for tool in deleted_tools:
-            click.echo("[{}]: {}".format(str(deleted_tools.index(tool)+1), tool.get_name()))
+        for i, tool in enumerate(deleted_tools, start=1):
+            click.echo("[{}]: {}".format(i, tool.get_name()))
 
         to_delete = None
         tool_to_save_indexes = input(">>> ")
@@ -147,4 +149,3 @@ def _delete_all(cfg: Config, deleted_tools: list, assume_yes: bool, log_fname: s
         if not to_delete:
             msg.Prints.info("No tool will be erased from file system", log_fname, CMD_NAME)
             sys.exit(1)
-    sys.exit(0)
@@ -8,9 +8,9 @@ CMD_NAME = "find"
 
 
 @click.command()
-@click.option("-u", "--url", help="Find repository by url.", metavar="<url>")
+@click.option("-u", "--url", help="Find repository by url, partial match.", metavar="<url>")
 @click.option("-t", "--tags", help="Find all so-tagged repository.", metavar="<t1,t2,...,tN>")
-@click.option("-n", "--name", multiple=True, help="Find tool by name.", metavar="<tool-name>")
+@click.option("-n", "--name", multiple=True, help="Find tool by name, partial match.", metavar="<tool-name>")
 @click.option("-p", "--type", multiple=True, help="Find tool by type.", metavar="<type-name>")
 @click.option("-d", "--last-update-date",
               help="Find repository having last update date greater then the one insert.", metavar="dd-mm-yyyy")
@@ -55,27 +55,30 @@ def find(ctx: click.core.Context, url: str, tags: str, name: str, type: str, las
 
         last_update_date = utl_dates.date_to_epoch(last_update_date)
 
-    if all:
-        # Retrieve all the tools
-        tools = cfg.get_tools()
+    # Retrieve all the tools just once
+    all_tools = cfg.get_tools()
+
+    if all or not all_tools:
+        # Every tool, nothing to search into if there's none
+        tools = all_tools
 
     else:
         # Retrieve tools that match searching criteria
         tools = utl_cmds.find_tool(cfg, url=url, tags=tags, name=name, _type=type, last_update_date=last_update_date,
-                                   f=True)
+                                   f=True, tools=all_tools)
 
     # Total. tools found
-    tot = 0
+    tot = len(tools)
     if tools:
         msg.Prints.info("Tools found:", log_fname, CMD_NAME)
         for tool in tools:
-            msg.Prints.info(str(tool) if not vrb else tool.__str__(vrb), log_fname, CMD_NAME, icon=False)
-            tot += 1
+            # __str__ defaults to the non verbose representation
+            msg.Prints.info(tool.__str__(vrb), log_fname, CMD_NAME, icon=False)
         print("")
 
     if not all:
         # Print summary if all is set
-        msg.Prints.info("Found {}/{} tools".format(tot, len(cfg.get_tools())), log_fname, CMD_NAME, icon=False)
+        msg.Prints.info("Found {}/{} tools".format(tot, len(all_tools)), log_fname, CMD_NAME, icon=False)
 
     elif tot != 0:
         msg.Prints.info("Tot tools: {}".format(len(tools)), log_fname, CMD_NAME, icon=False)
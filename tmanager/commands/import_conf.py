@@ -1,9 +1,12 @@
 import click
+import io
 import os
+import re
 import sys
 import time
 import zipfile
 import tempfile
+import typing
 import tmanager.utilities.file_system as utl_fs
 import tmanager.utilities.commands as utl_cmds
 import tmanager.core.messages.messages as msg
@@ -13,6 +16,12 @@ from tmanager.core.tool.localfile.localfile import LocalFile
 
 CMD_NAME = "import_config"
 
+# Tool types that can be imported
+_valid_types = frozenset({"git", "local"})
+
+# Every exported property is a comma separated "key-value" pair
+_property_re = re.compile(r"([^,\-]+)-([^,]*)")
+
 
 @click.command(short_help="Import configuration file and tools.")
 @click.option("-i", "--infile", help="Input configuration file.", metavar="<pathname>", required=True)
@@ -51,18 +60,17 @@ def import_conf(ctx: click.core.Context, infile: str, types: str, tags: str, log
             sys.exit(1)
 
     # Validate input types and input tags (if any)
-    import_types = set()
-    if types:
-        for t in types.split(","):
-            t = t.strip()
-            if t in ["git", "local"]:
-                import_types.add(t)
-    import_types = list(import_types)
-    import_tags = utl_cmds.sanitize_tags(tags)
-
-    # Validate input filename
-    if not utl_fs.is_writable(infile):
-        msg.Prints.info("'{}' does not exist or it's just not writable".format(infile), log_fname, CMD_NAME)
+    import_types = frozenset(t.strip() for t in types.split(",")) & _valid_types if types else frozenset()
+    import_tags = frozenset(utl_cmds.sanitize_tags(tags))
+
+    # Attempt to open the ZIP archive, opening it is what tells whether it exists and can be read
+    try:
+        zip_h = zipfile.ZipFile(infile, 'r')
+    except OSError:
+        msg.Prints.info("'{}' does not exist or it's just not readable".format(infile), log_fname, CMD_NAME)
+        sys.exit(1)
+    except zipfile.BadZipFile:
+        msg.Prints.info("The file '{}' doesn't seem a ZIP archive".format(infile), log_fname, CMD_NAME)
         sys.exit(1)
 
     # Attempt to load the configuration file
@@ -72,16 +80,6 @@ def import_conf(ctx: click.core.Context, infile: str, types: str, tags: str, log
         msg.Prints.info("Configuration file not found", log_fname, CMD_NAME)
         new_cfg.first_configuration(importing=True)
 
-    # Attempt to open the ZIP archive
-    zip_h = None
-    try:
-        zip_h = zipfile.ZipFile(infile, 'r')
-    except zipfile.BadZipFile:
-        msg.Prints.info("The file '{}' doesn't seem a ZIP archive".format(infile), log_fname, CMD_NAME)
-        if zip_h:
-            zip_h.close()
-        sys.exit(1)
-
     # Detect the configuration file and quit if none is found
     try:
         zip_h.getinfo("conf.tman")
@@ -94,38 +92,24 @@ def import_conf(ctx: click.core.Context, infile: str, types: str, tags: str, log
         sys.exit(1)
 
     # Retrieve tools from the archive (if any)
-    tools_to_import = set()
-    for t in zip_h.namelist():
-        if t != "conf.tman":
-            tools_to_import.add(t.split("/", 1)[0])
-    tools_to_import = list(tools_to_import)
-
-    # Retrieve current file/tools
-    managed_tools = new_cfg.get_tools()
-
-    # Unzip the input file into
-    tmp_dir = "{}/export-{}".format(tempfile.gettempdir(), int(time.time()))
-    zip_h.extractall(tmp_dir)
-
-    # Attempt to import the configuration file ONLY
-    if len(tools_to_import) == 0:
-        _import_conf_file(managed_tools, new_cfg, "{}/{}".format(tmp_dir, "conf.tman"), assume_yes, log_fname,
-                          import_types=import_types if types else None, import_tags=import_tags if tags else None)
+    tools_to_import = {t.split("/", 1)[0] for t in zip_h.namelist() if t != "conf.tman"}
 
-    else:
+    if len(tools_to_import) != 0:
         msg.Prints.info("Importing tools, this may take a while..", log_fname, CMD_NAME)
-        _import_conf_file(managed_tools, new_cfg, "{}/{}".format(tmp_dir, "conf.tman"), assume_yes, log_fname,
+
+    # Import the configuration file, read straight from the archive
+    with io.TextIOWrapper(zip_h.open("conf.tman"), encoding="utf-8") as conf_file:
+        _import_conf_file(new_cfg, conf_file, assume_yes, log_fname,
                           import_types=import_types if types else None, import_tags=import_tags if tags else None)
-        _import_tools_from_archive(new_cfg, "{}{}".format(tmp_dir, "/" if not tmp_dir.endswith("/") else ""),
-                                   assume_yes, log_fname, import_types=import_types if types else None,
+
+    # Then import the tools, if any
+    if len(tools_to_import) != 0:
+        _import_tools_from_archive(new_cfg, zip_h, assume_yes, log_fname, import_types=import_types if types else None,
                                    import_tags=import_tags if tags else None)
 
     # Auto_install if required
     new_cfg.auto_install()
 
-    # delete temp files
-    utl_fs.delete_from_fs(tmp_dir)
-
     # close the handler
     if zip_h:
         zip_h.close()
@@ -133,153 +117,124 @@ def import_conf(ctx: click.core.Context, infile: str, types: str, tags: str, log
     sys.exit(0)
 
 
-def _import_conf_file(all_tools: list, new_cfg: Config, input_conf: str, assume_yes: bool, log_fname: str,
-                      import_types: list = None, import_tags: list = None) -> None:
+def _import_conf_file(new_cfg: Config, conf_file: typing.TextIO, assume_yes: bool, log_fname: str,
+                      import_types: frozenset = None, import_tags: frozenset = None) -> None:
     """
     Attempt to import a tman configuration file.
 
-    :param list all_tools: tool list
     :param Config new_cfg: configuration object
-    :param str input_conf: input configuration file
+    :param TextIO conf_file: input configuration file
     :param bool assume_yes: assume YES for any user prompt
     :param str log_fname: log filename
     :return: None
     """
-    # Parse the tman configuration file and import the configuration
+    # Parse the tman configuration file and import the configuration, every tool shares the same add date
     b = False
-    with open(input_conf, "r") as f:
-        for line in f.readlines():
-            line = line.strip()
-            match_type = True
-            match_tag = False
-            if not b:
-                # First line: general configurations
-                b = True
-                for val in line.split(","):
-                    r = val.split("-", 1)
-                    if r[1] in ["True", "False"]:
-                        # Convert JSON "True/False" into True/False
-                        r[1] = True if r[1] == "True" else False
-
-                    # Set the property
-                    new_cfg[r[0]] = r[1]
-
-            else:
-                # Other line: Tool representation
-                dict_repo = {}
-                line, tags = utl_cmds.remove_tags(line)
-
-                # skip tools that have no matching tag name
-                if import_tags:
-                    for tag in tags:
-                        if tag in import_tags:
-                            match_tag = True
-                            break
-                    if not match_tag:
-                        continue
-
-                dict_repo["tags"] = tags
-
-                # Create a dictionary representing a tool
-                for prop in line.split(","):
-                    if prop == '':
-                        continue
-
-                    # Parse tool's property
-                    res = prop.split("-", 1)
-
-                    # skip tools that don't match types criteria
-                    if res[0] == "type" and (import_types is not None and res[1] not in import_types):
-                        match_type = False
-                        break
-
-                    # Add tool property
-                    dict_repo[res[0]] = res[1]
-
-                # skip tools with bad type
-                if not match_type:
-                    continue
-
-                # Instantiates a new Tool
-                if dict_repo["url"] == "-":
-                    if os.path.exists(dict_repo["directory"]):
-                        tool = LocalFile(dict_repo["directory"], tags=tags, add_date=time.time())
-
-                    else:
-                        tool = LocalFile(dict_repo["directory"], tags=tags, add_date=time.time())
+    add_date = time.time()
+    for line in conf_file:
+        line = line.strip()
+        if not b:
+            # First line: general configurations
+            b = True
+            for key, value in _property_re.findall(line):
+                if value in ["True", "False"]:
+                    # Convert JSON "True/False" into True/False
+                    value = True if value == "True" else False
+
+                # Set the property
+                new_cfg[key] = value
+
+        else:
+            # Other line: Tool representation
+            line, tags = utl_cmds.remove_tags(line)
+
+            # skip tools that have no matching tag name
+            if import_tags and import_tags.isdisjoint(tags):
+                continue
+
+            # Create a dictionary representing a tool
+            dict_repo = dict(_property_re.findall(line))
+            dict_repo["tags"] = tags
+
+            # skip tools that don't match types criteria
+            if import_types is not None and "type" in dict_repo and dict_repo["type"] not in import_types:
+                continue
+
+            # Instantiates a new Tool
+            if dict_repo["url"] == "-":
+                if os.path.exists(dict_repo["directory"]):
+                    tool = LocalFile(dict_repo["directory"], tags=tags, add_date=add_date)
 
                 else:
-                    tool = Repository(dict_repo["url"], dict_repo["directory"], name=dict_repo["name"], tags=tags,
-                                      add_date=time.time())
-
-                # Add the tool if it's not None nor already managed
-                if tool is not None:
-                    if all_tools.__contains__(tool):
-                        # If the tool is already managed, then prompt confirmation
-                        if assume_yes or click.confirm(msg.Echoes.input("{} is already managed, overwrite "
-                                                                        "its configuration?".format(tool.get_name())),
-                                                       default=True):
-                            new_cfg.update_tool(tool)
+                    tool = LocalFile(dict_repo["directory"], tags=tags, add_date=add_date)
 
-                    else:
-                        new_cfg.add_tool(tool)
+            else:
+                tool = Repository(dict_repo["url"], dict_repo["directory"], name=dict_repo["name"], tags=tags,
+                                  add_date=add_date)
+
+            # Add the tool if it's not None nor already managed
+            if tool is not None:
+                if new_cfg.has_tool(tool.get_name()):
+                    # If the tool is already managed, then prompt confirmation
+                    if assume_yes or click.confirm(msg.Echoes.input("{} is already managed, overwrite "
+                                                                    "its configuration?".format(tool.get_name())),
+                                                   default=True):
+                        new_cfg.update_tool(tool)
 
-                    new_cfg.save()
+                else:
+                    new_cfg.add_tool(tool)
 
     new_cfg.save()
     msg.Prints.info("Configuration file saved", log_fname, CMD_NAME)
 
 
-def _import_tools_from_archive(new_cfg: Config, tmp_dir: str, assume_yes: bool, log_fname: str,
-                               import_types: list = None, import_tags: list = None) -> None:
+def _import_tools_from_archive(new_cfg: Config, zip_h: zipfile.ZipFile, assume_yes: bool, log_fname: str,
+                               import_types: frozenset = None, import_tags: frozenset = None) -> None:
     """
     Import tools from archive.
 
     :param Config new_cfg: tman configuration object
-    :param str tmp_dir: temporary directory for extracting the archive
+    :param zipfile.ZipFile zip_h: archive handler
     :param bool assume_yes: should assume all positive answers to any confirmation prompt?
     :return: None
     """
-
-    # Retrieve file names contained into the compressed file
-    files = os.listdir(tmp_dir)
-
-    # Compute their absolute pathnames
-    abs_name = [tmp_dir + f for f in files]
-
-    # Add every tool that is not managed
-    temp = new_cfg.get_tools()
+    # Retrieve the archive members, by tool name
+    members = {}
+    for n in zip_h.namelist():
+        if n != "conf.tman":
+            members.setdefault(n.split("/", 1)[0], []).append(n)
+
+    # Retrieve the managed tools that are in the archive and match any tag/type that is provided
+    temp = []
+    for t in new_cfg.get_tools():
+        if t.get_name() in members and (not import_types or t.get_type() in import_types):
+            # skip tools that have no matching tag name
+            if import_tags and import_tags.isdisjoint(t.get_tags()):
+                continue
+            temp.append(t)
+
+    # Extract just those tools into a temporary directory
+    tmp_dir = utl_fs.trailing_slash(tempfile.mkdtemp(prefix="export-"))
+    zip_h.extractall(tmp_dir, members=[m for t in temp for m in members[t.get_name()]])
 
     # For any tool t
     tot_imported = 0
     for t in temp:
-        # And for any computed absolute pathname absf
-        for absf in abs_name:
-            # If name matches, then try to copy it (also ensure that the tool matches any tag/type that is provided)
-            if t.get_name() == utl_fs.get_file_name(absf) and (not import_types or t.get_type() in import_types):
-                if import_tags:
-                    match_tags = False
-                    for tag in t.get_tags():
-                        if tag in import_tags:
-                            match_tags = True
-                            break
-                    # skip tools that have no matching tag name
-                    if not match_tags:
-                        continue
-                if os.path.exists(t.get_directory()):
-                    # Prompt for action if the file already exists
-                    if assume_yes or click.confirm(msg.Echoes.input("{} already exists, overwrite?".format(
-                            t.get_directory())), default=False):
-                        if utl_fs.move_file(tmp_dir + utl_fs.get_file_name(absf), t.get_directory()) == 0:
-                            msg.Prints.success("{} replaced".format(t.get_directory()), log_fname, CMD_NAME)
-                            tot_imported += 1
-
-                else:
-                    # Move the file it doesn't yet exist
-                    utl_fs.move_file(tmp_dir + utl_fs.get_file_name(absf), t.get_directory())
+        # Try to copy it
+        absf = tmp_dir + t.get_name()
+        tool_dir = t.get_directory()
+        if os.path.exists(tool_dir):
+            # Prompt for action if the file already exists
+            if assume_yes or click.confirm(msg.Echoes.input("{} already exists, overwrite?".format(tool_dir)),
+                                           default=False):
+                if utl_fs.move_file(absf, tool_dir) == 0:
+                    msg.Prints.success("{} replaced".format(tool_dir), log_fname, CMD_NAME)
                     tot_imported += 1
 
-                break
+        else:
+            # Move the file it doesn't yet exist
+            utl_fs.move_file(absf, tool_dir)
+            tot_imported += 1
 
     if tot_imported != 0:
         msg.Prints.success("tools imported properly", log_fname, CMD_NAME)
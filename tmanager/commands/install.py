@@ -4,13 +4,16 @@ import tmanager.utilities.dates as utl_dates
 import tmanager.utilities.file_system as utl_fs
 import tmanager.utilities.commands as utl_cmds
 import tmanager.core.messages.messages as msg
+from tmanager.core.config.config import Config
+from tmanager.core.tool.repository.repository import Repository
 
 CMD_NAME = "install"
+_MAX_CLONES = 8
 
 
 @click.command()
-@click.option("-n", "--name", help="Tool name to install.", metavar="<tool-name>")
-@click.option("-u", "--repo-url", help="Repo URL to install.", metavar="<url>")
+@click.option("-n", "--name", help="Tool name to install (exact match).", metavar="<tool-name>")
+@click.option("-u", "--repo-url", help="Repo URL to install (exact match).", metavar="<url>")
 @click.option("-a", "--all", is_flag=True, help="Install all registered tool.")
 @click.option("-l", "--log", help="Log to file instead of printing to stdout.", metavar="<filename>")
 @click.option("-y", "--assume-yes", is_flag=True, help="Assume yes.")
@@ -62,47 +65,38 @@ def install_repository(ctx: click.core.Context, name: str, repo_url: str, _all:
     """
     cfg = utl_cmds.get_configs_from_context(ctx)
 
-    if name:
-        # Find tools by name
-        tools = utl_cmds.find_tool(cfg, name=name)
+    # Search criteria, only the given ones are applied
+    criteria = {k: v for k, v in (("name", name), ("url", repo_url)) if v}
 
-    elif repo_url:
-        # Find tools by URL
-        tools = utl_cmds.find_tool(cfg, url=repo_url)
-
-    elif _all:
+    if _all:
         # Retrieve all the tools
         tools = cfg.get_tools(repo_only=True)
 
+    elif criteria:
+        # Find tools by name and/or URL
+        tools = utl_cmds.find_tool(cfg, **criteria)
+
     else:
         tools = []
 
+    # Only git repositories can be installed
+    tools = [t for t in tools if t.is_git_repo()]
+
     # If there's no tool to install, display error message and return
     if len(tools) == 0:
         msg.Prints.warning("there's no tool to install", log_fname, CMD_NAME)
         return 1
 
     # Install any tool that matches the criteria
-    tot_installed = 0
     installed = list()
-    for tool in tools:
-        if not tool.is_git_repo():
-            continue
-        # Clone the repository
-        res = tool.clone()
+    # Clone the repositories in parallel, conflicts are then resolved one at a time
+    for tool, res in zip(tools, Repository.clone_many(tools, _MAX_CLONES)):
         # If everything went fine
         if res == 0:
-            tot_installed += 1
-
             if not _all:
                 msg.Prints.info("'{}' cloned successfully".format(tool.get_name()), log_fname, CMD_NAME)
 
-            # append the tool name to the installed toolnames list
-            installed.append(tool.get_name())
-            # Update repo install date and last-update-date
-            tool.update_timestamps()
-            # Update the configuration file
-            cfg.update_tool(tool)
+            _record_install(cfg, tool, installed)
 
         elif res == 2:
             # If directory found when cloning you've 3 choices:
@@ -123,11 +117,8 @@ def install_repository(ctx: click.core.Context, name: str, repo_url: str, _all:
                 utl_fs.delete_from_fs(tool.get_directory())
                 msg.Prints.info("cloning '{}'..".format(tool.get_name()), log_fname, CMD_NAME,
                                 icon=True)
-                tool.clone()
-                # Update repo install date and last-update-date
-                tool.update_timestamps()
-                # Update the tool in the conf.
-                cfg.update_tool(tool)
+                if tool.clone() == 0:
+                    _record_install(cfg, tool, installed)
 
             elif choice == "3":
                 # Just update the repo content
@@ -154,9 +145,25 @@ def install_repository(ctx: click.core.Context, name: str, repo_url: str, _all:
                 continue
 
     if _all:
-        msg.Prints.info("Installed {}{}/{} tools".format("" if tot_installed == 0 else "{}, ".format(str(installed)),
-                                                         tot_installed, len(tools)), log_fname, CMD_NAME,
+        msg.Prints.info("Installed {}{}/{} tools".format("" if not installed else "{}, ".format(str(installed)),
+                                                         len(installed), len(tools)), log_fname, CMD_NAME,
                         icon=False)
 
+    # Save every change at once
     cfg.save()
     return 0
+
+
+def _record_install(cfg: Config, tool: Repository, installed: list) -> None:
+    """
+    Record a freshly cloned tool: update its install and last-update dates in the configuration
+    and append its name to the installed tool names.
+
+    :param Config cfg: tman configuration object
+    :param Repository tool: cloned tool
+    :param list installed: installed tool names
+    :return: None
+    """
+    tool.update_timestamps()
+    cfg.update_tool(tool)
+    installed.append(tool.get_name())
@@ -1,4 +1,5 @@
 import click
+import os
 import sys
 import tmanager.core.messages.messages as msg
 import tmanager.utilities.commands as utl_cmds
@@ -48,140 +49,142 @@ def modify(ctx: click.core.Context, name: str, new_dir: str, tag_add: str, tag_r
     cfg = utl_cmds.get_configs_from_context(ctx)
     vrb = utl_cmds.get_verbose_from_context(ctx)
 
-    msg.Prints.verbose("Retrieving tool {}".format(name), vrb, log_fname, CMD_NAME)
+    msg.Prints.verbose("Retrieving tool {}", vrb, log_fname, CMD_NAME, fmt_args=(name,))
 
     # Retrieve tool object
     tool = cfg.get_tool(name)
     if tool is None:
-        raise click.ClickException(msg.Echoes.error("There's no such tool. Make sure you wrote the correct name."))
+        raise _error("There's no such tool. Make sure you wrote the correct name.")
 
-    msg.Prints.verbose("Tool {} found: {}".format(tool.get_name(), str(tool)), vrb, log_fname, CMD_NAME)
-    msg.Prints.verbose("Retrieving {}'s tags".format(tool.get_name()), vrb, log_fname, CMD_NAME)
+    tool_name = tool.get_name()
+    msg.Prints.verbose("Tool {} found: {}", vrb, log_fname, CMD_NAME, fmt_args=(tool_name, tool))
+    msg.Prints.verbose("Retrieving {}'s tags", vrb, log_fname, CMD_NAME, fmt_args=(tool_name,))
 
     # Retrieving tool tags
-    tool_tags = tool.get_tags()
+    tool_tags = set(tool.get_tags())
 
-    msg.Prints.verbose("Tags retrieved: {}".format(tool.get_tags()), vrb, log_fname, CMD_NAME)
+    msg.Prints.verbose("Tags retrieved: {}", vrb, log_fname, CMD_NAME, fmt_args=(tool.get_tags(),))
+
+    # Tags are set and every change is saved at once, even when a later option fails after an earlier one succeeded
+    dirty = False
+    try:
+        # Attempt to modify installation-directory
+        if new_dir:
+            msg.Prints.verbose("Changing tool installation directory", vrb, log_fname, CMD_NAME)
 
-    # Attempt to modify installation-directory
-    if new_dir:
-        msg.Prints.verbose("Changing tool installation directory", vrb, log_fname, CMD_NAME)
+            # Make sure the directory exists and is writable.
+            if utl_fs.is_writable(new_dir):
+                src_dir = tool.get_directory()
+                dst_dir = os.path.join(new_dir, tool_name)
 
-        # Make sure the directory exists and is writable.
-        if utl_fs.is_writable(new_dir):
-            src_dir = tool.get_directory()
-            dst_dir = "{}{}{}".format(new_dir, "" if new_dir.endswith("/") else "/", tool.get_name())
+                msg.Prints.verbose("Try to move the tool", vrb, log_fname, CMD_NAME)
 
-            msg.Prints.verbose("Try to move the tool", vrb, log_fname, CMD_NAME)
+                # Move the tool into the new directory
+                errcode = utl_fs.move_file(src_dir, dst_dir)
 
-            # Move the tool into the new directory
-            errcode = utl_fs.move_file(src_dir, dst_dir)
+                if errcode == 1:
+                    raise _error("The directory '{}' already exists!".format(new_dir))
+                elif errcode == 3:
+                    raise _error("The directory specified: {} already exists and is not empty".format(dst_dir))
+                elif errcode != 0:
+                    raise _error("An unexpected error occurred while copying '{}' directory.".format(new_dir))
 
-            if errcode == 1:
-                raise click.ClickException(msg.Echoes.error("The directory '{}' already exists!".format(new_dir)))
-            elif errcode == 3:
-                raise click.ClickException(
-                    msg.Echoes.error("The directory specified: {} already exists and is not empty".format(dst_dir)))
-            elif errcode != 0:
-                raise click.ClickException(msg.Echoes.error("An unexpected error occurred while copying '{}' directory."
-                                                            .format(new_dir)))
+                msg.Prints.verbose("Tool moved", vrb, log_fname, CMD_NAME)
+                msg.Prints.verbose("Setting new tool directory", vrb, log_fname, CMD_NAME)
 
-            msg.Prints.verbose("Tool moved", vrb, log_fname, CMD_NAME)
-            msg.Prints.verbose("Setting new tool directory", vrb, log_fname, CMD_NAME)
+                # Everything went fine, modify tool's installation directory
+                tool.set_directory(new_dir)
+                msg.Prints.success("New tool directory set successfully!", log_fname, CMD_NAME)
 
-            # Everything went fine, modify tool's installation directory
-            tool.set_directory(new_dir)
-            msg.Prints.success("New tool directory set successfully!", log_fname, CMD_NAME)
+                dirty = True
 
-            # Save changes
-            _save_changes(cfg, tool, vrb, log_fname)
+            else:
+                raise _error("The directory '{}' does not exist or you don't have enough access rights".format(new_dir))
 
-        else:
-            raise click.ClickException(
-                msg.Echoes.error("The directory '{}' does not exist or you don't have enough access rights"
-                                 .format(new_dir)))
+        # Attempt to add one or more tags
+        if tag_add:
+            msg.Prints.verbose("Adding tags to {}", vrb, log_fname, CMD_NAME, fmt_args=(tool_name,))
 
-    # Attempt to add one or more tags
-    if tag_add:
-        msg.Prints.verbose("Adding tags to {}".format(tool.get_name()), vrb, log_fname, CMD_NAME)
+            tmp_tags = utl_cmds.sanitize_tags(tag_add)
+            msg.Prints.verbose("Following tags will be added: {}", vrb, log_fname, CMD_NAME, fmt_args=(tmp_tags,))
 
-        tmp_tags = utl_cmds.sanitize_tags(tag_add)
-        msg.Prints.verbose("Following tags will be added: {}".format(tmp_tags), vrb, log_fname, CMD_NAME)
+            added_tags = [tag for tag in tmp_tags if tag not in tool_tags]
+            tool_tags.update(added_tags)
+            msg.Prints.success("Following tags have been successfully added: {}".format(added_tags) if
+                               len(added_tags) != 0 else "No tags added", log_fname, CMD_NAME)
 
-        added_tags = []
-        for tag in tmp_tags:
-            if tag not in tool_tags:
-                msg.Prints.verbose("Adding tags '{}' to {}".format(tag, tool.get_name()), vrb, log_fname, CMD_NAME)
+            # Nothing to save if the tool already had every tag
+            if added_tags:
+                dirty = True
+            else:
+                msg.Prints.verbose("{} already has all the given tags", vrb, log_fname, CMD_NAME, fmt_args=(tool_name,))
 
-                tool_tags.append(tag)
-                added_tags.append(tag)
+        # Attempt to remove one or more tags
+        if tag_rm:
+            msg.Prints.verbose("Removing tags to {}", vrb, log_fname, CMD_NAME, fmt_args=(tool_name,))
 
-        tool.set_tags(tool_tags)
-        msg.Prints.success("Following tags have been successfully added: {}".format(added_tags), log_fname, CMD_NAME)
+            tmp_tags = utl_cmds.sanitize_tags(tag_rm)
+            msg.Prints.verbose("Following tags will be removed: {}", vrb, log_fname, CMD_NAME, fmt_args=(tmp_tags,))
 
-        # Save changes
-        _save_changes(cfg, tool, vrb, log_fname)
+            removed_tags = [tag for tag in tmp_tags if tag in tool_tags]
+            tool_tags.difference_update(removed_tags)
+            msg.Prints.success("Following tags have been successfully removed: {}".format(removed_tags) if
+                               len(removed_tags) != 0 else "No tags removed", log_fname, CMD_NAME)
 
-    # Attempt to remove one or more tags
-    if tag_rm:
-        msg.Prints.verbose("Removing tags to {}".format(tool.get_name()), vrb, log_fname, CMD_NAME)
+            # Nothing to save if the tool had none of the given tags
+            if removed_tags:
+                dirty = True
+            else:
+                msg.Prints.verbose("{} has none of the given tags", vrb, log_fname, CMD_NAME, fmt_args=(tool_name,))
 
-        tmp_tags = utl_cmds.sanitize_tags(tag_rm)
-        msg.Prints.verbose("Following tags will be removed: {}".format(tmp_tags), vrb, log_fname, CMD_NAME)
+        # Attempt to modify a tag
+        if tag_mv:
+            msg.Prints.verbose("Renaming tags of {}", vrb, log_fname, CMD_NAME, fmt_args=(tool_name,))
 
-        removed_tags = []
-        for tag in tmp_tags:
-            if tag in tool_tags:
-                msg.Prints.verbose("Removing tags '{}' to {}".format(tag, tool.get_name()), vrb, log_fname, CMD_NAME)
+            old_tag, new_tag = tag_mv
+            msg.Prints.verbose("Renaming tag {} to {}", vrb, log_fname, CMD_NAME, fmt_args=(old_tag, new_tag))
+            msg.Prints.verbose("Check if {} has tag {}", vrb, log_fname, CMD_NAME, fmt_args=(tool_name, old_tag))
 
-                tool_tags.remove(tag)
-                removed_tags.append(tag)
+            # Make sure the tool has the old tag
+            if old_tag in tool_tags:
+                msg.Prints.verbose("Tool {} has tag {}", vrb, log_fname, CMD_NAME, fmt_args=(tool_name, old_tag))
+                msg.Prints.verbose("Check if {} hasn't already new tag {}", vrb, log_fname, CMD_NAME,
+                                   fmt_args=(tool_name, new_tag))
 
-        tool.set_tags(tool_tags)
-        msg.Prints.success("Following tags have been successfully removed: {}".format(removed_tags) if
-                           len(removed_tags) != 0 else "No tags removed", log_fname, CMD_NAME)
+                # And make sure the tool has NOT already the new tag
+                if new_tag in tool_tags:
+                    raise _error("The tool '{}' already has tag '{}'.".format(tool_name, new_tag))
 
-        # Save changes
-        _save_changes(cfg, tool, vrb, log_fname)
+                msg.Prints.verbose("Attempting to remove tag {} from {}", vrb, log_fname, CMD_NAME,
+                                   fmt_args=(old_tag, tool_name))
 
-    # Attempt to modify a tag
-    if tag_mv:
-        msg.Prints.verbose("Renaming tags of {}".format(tool.get_name()), vrb, log_fname, CMD_NAME)
+                tool_tags.remove(old_tag)
+                msg.Prints.verbose("Old tag {} removed", vrb, log_fname, CMD_NAME, fmt_args=(old_tag,))
+                msg.Prints.verbose("Attempting to add new tag {}", vrb, log_fname, CMD_NAME, fmt_args=(new_tag,))
 
-        old_tag, new_tag = tag_mv
-        msg.Prints.verbose("Renaming tag {} to {}".format(old_tag, new_tag), vrb, log_fname, CMD_NAME)
-        msg.Prints.verbose("Check if {} has tag {}".format(tool.get_name(), old_tag), vrb, log_fname, CMD_NAME)
-
-        # Make sure the tool has the old tag
-        if old_tag in tool_tags:
-            msg.Prints.verbose("Tool {} has tag {}".format(tool.get_name(), old_tag), vrb, log_fname, CMD_NAME)
-            msg.Prints.verbose("Check if {} hasn't already new tag {}".format(tool.get_name(), new_tag), vrb, log_fname,
-                               CMD_NAME)
-
-            # And make sure the tool has NOT already the new tag
-            if new_tag in tool_tags:
-                raise click.ClickException(msg.Echoes.error("The tool '{}' already has tag '{}'."
-                                                            .format(tool.get_name(), new_tag)))
-
-            msg.Prints.verbose("Attempting to remove tag {} from {}".format(old_tag, tool.get_name()), vrb, log_fname,
+                tool_tags.add(new_tag)
+                msg.Prints.verbose("New tag {} added to {}", vrb, log_fname, CMD_NAME, fmt_args=(new_tag, tool_name))
+            else:
+                raise _error("The tool '{}' has no tag '{}'.".format(tool_name, old_tag))
+
+            msg.Prints.success("{} tag has been successfully renamed in {}".format(old_tag, new_tag), log_fname,
                                CMD_NAME)
 
-            tool_tags.remove(old_tag)
-            msg.Prints.verbose("Old tag {} removed".format(old_tag), vrb, log_fname, CMD_NAME)
-            msg.Prints.verbose("Attempting to add new tag {}".format(new_tag), vrb, log_fname, CMD_NAME)
+            dirty = True
+    finally:
+        if dirty:
+            tool.set_tags(sorted(tool_tags))
+            _save_changes(cfg, tool, vrb)
 
-            tool_tags.append(new_tag)
-            msg.Prints.verbose("New tag {} added to {}".format(new_tag, tool.get_name()), vrb, log_fname, CMD_NAME)
-        else:
-            raise click.ClickException(msg.Echoes.error("The tool '{}' has no tag '{}'."
-                                                        .format(tool.get_name(), old_tag)))
 
-        tool.set_tags(tool_tags)
-        msg.Prints.success("{} tag has been successfully renamed in {}".format(old_tag, new_tag), log_fname, CMD_NAME)
+def _error(message: str) -> click.ClickException:
+    """
+    Build the exception to raise for the given error message.
 
-        # Save changes
-        _save_changes(cfg, tool, vrb, log_fname)
-    sys.exit(0)
+    :param str message: error message
+    :return click.ClickException: exception to raise
+    """
+    return click.ClickException(msg.Echoes.error(message))
 
 
 def _save_changes(cfg: Config, tool: Tool, vrb: bool, log_fname: str) -> None:
@@ -193,7 +196,7 @@ def _save_changes(cfg: Config, tool: Tool, vrb: bool, log_fname: str) -> None:
     :param bool vrb: should print verbose messages?
     :return: None
     """
-    msg.Prints.verbose("Updating tool {}...".format(tool.get_name()), vrb, log_fname, CMD_NAME)
+    msg.Prints.verbose("Updating tool {}...", vrb, log_fname, CMD_NAME, fmt_args=(tool.get_name(),))
     cfg.update_tool(tool)
     cfg.save()
-    msg.Prints.verbose("Tool {} saved".format(tool.get_name()), vrb, log_fname, CMD_NAME)
+    msg.Prints.verbose("Tool {} saved", vrb, log_fname, CMD_NAME, fmt_args=(tool.get_name(),))
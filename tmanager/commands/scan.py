@@ -1,16 +1,26 @@
 import click
+import concurrent.futures
+import itertools
 import os
-import fnmatch
 import sys
 import time
 import threading
-import git
 import tmanager.core.messages.messages as msg
 import tmanager.utilities.file_system as utl_fs
 import tmanager.utilities.commands as utl_cmds
 
 from tmanager.core.tool.repository.repository import Repository
 
+# Number of threads walking the first-level directories of root-dir, the walk is bound to filesystem syscalls
+_MAX_SEEKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Spinner shown while searching and seconds between its frames
+_SPINNER_FRAMES = "/—\\|"
+_SPINNER_DELAY = .05
+
+# Directories whose content is never worth scanning: package caches, virtualenvs and tooling leftovers
+_skipped_dirs = frozenset({"node_modules", ".venv", "__pycache__", ".tox", ".mypy_cache"})
+
 
 @click.command(options_metavar="", short_help="Scan filesystem seeking repositories.")
 @click.argument("root-dir", required=False, metavar="<root-dir>")
@@ -43,20 +53,40 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
     repos_list = []
     msg.Prints.verbose("Start searching daemon", vrb)
 
-    search = threading.Thread(name='repo_search', target=_repo_seeker, args=(root_dir, repos_list))
-    search.daemon = True
-    search.start()
+    # Split the search among the first-level directories of root_dir, each one with its own result list
+    is_repo, subdirs = _scan_dir(root_dir)
+    if is_repo:
+        repos_list.append((root_dir, os.path.basename(root_dir)))
+
+    subdirs_repos = [[] for _ in subdirs]
+    stop = threading.Event()
+
+    # Animate the spinner only on a terminal, piped output just waits for the search to end
+    animate = sys.stdout.isatty()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=_MAX_SEEKERS, thread_name_prefix="repo_search") as executor:
+        search = [executor.submit(_repo_seeker, d, r, stop) for d, r in zip(subdirs, subdirs_repos)]
+
+        try:
+            if animate:
+                # Draw one spinner frame at a time, the wait returns as soon as the search is over
+                frames = itertools.cycle(_SPINNER_FRAMES)
+                while concurrent.futures.wait(search, timeout=_SPINNER_DELAY).not_done:
+                    _animated_loading(next(frames))
+            else:
+                concurrent.futures.wait(search)
+        except KeyboardInterrupt:
+            stop.set()
+            msg.Prints.verbose("Searching deamon has been stopped", vrb)
+            msg.Prints.verbose(" Quitting...", vrb)
+            raise click.Abort()
 
-    try:
-        while search.is_alive():
-            _animated_loading()
-    except KeyboardInterrupt:
-        msg.Prints.verbose("Searching deamon has been stopped", vrb)
-        msg.Prints.verbose(" Quitting...", vrb)
-        raise click.Abort()
+    # Merge the results following the first-level directories order
+    for repos in subdirs_repos:
+        repos_list.extend(repos)
 
     # Delete "searching..." line
-    sys.stdout.write("\r")
+    if animate:
+        sys.stdout.write("\r")
 
     msg.Prints.warning("{} repositories found".format(len(repos_list)))
 
@@ -65,11 +95,8 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
         msg.Prints.verbose("Listing repositories", vrb)
 
         # List repositories found
-        i = 0
-        for repo in repos_list:
-            name = repo.split("/")[-1]
-            msg.Prints.info("{}. {}, {}".format(i+1, name, repo))
-            i += 1
+        for i, (repo, name) in enumerate(repos_list, 1):
+            msg.Prints.info("{}. {}, {}".format(i, name, repo))
 
         # Ask the user to add all repositories found
         add_it_all = click.confirm(msg.Echoes.input("Do you want to add all of them?"), default=False)
@@ -80,7 +107,7 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
             msg.Prints.verbose("All repositories found are going to be added", vrb)
             msg.Prints.verbose("Generating repositories indexes", vrb)
 
-            chosen_indexes = [*range(len(repos_list))]
+            chosen_indexes = range(len(repos_list))
 
         # KO, ask to user which repository should be added
         else:
@@ -96,7 +123,7 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
                 # Sanitize input
                 chosen_indexes = utl_cmds.sanitize_indexes(repos_list, chosen_indexes)
 
-                msg.Prints.verbose("Indexes sanitized: {}".format(chosen_indexes), vrb)
+                msg.Prints.verbose("Indexes sanitized: {}", vrb, fmt_args=(chosen_indexes,))
 
                 # If there are any indexes after index sanitize
                 if chosen_indexes:
@@ -107,8 +134,7 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
                     if vrb:
                         msg.Prints.warning("The following repositories will be added in tman:")
                         for i in chosen_indexes:
-                            path = repos_list[i]
-                            name = path.split("/")[-1]
+                            path, name = repos_list[i]
                             msg.Prints.info("{}, {}".format(name, path))
 
                 else:
@@ -123,10 +149,13 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
 
         msg.Prints.verbose("Start to add desired repositories", vrb)
 
-        # Add selected repositories to tman
+        # GitPython is only needed once some repositories have to be added
+        import git
+
+        # Add selected repositories to tman, all of them share the same dates
+        add_time = time.time()
         for i in chosen_indexes:
-            repo_dir = repos_list[i]
-            repo_name = repo_dir.split("/")[-1]
+            repo_dir, repo_name = repos_list[i]
             git_repo = git.Repo(repo_dir)
             try:
                 repo_url = git_repo.remote("origin").url
@@ -134,13 +163,13 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
                 msg.Prints.warning("Skipping {}, no origin found".format(repo_name))
                 continue
 
-            add_time = time.time()
             repository = Repository(repo_url, repo_dir, name=repo_name, add_date=add_time,
                                     install_date=add_time, last_update_date=add_time)
 
-            msg.Prints.verbose("{} is going to be added".format(repository.__str__(True)), vrb)
+            if vrb:
+                msg.Prints.verbose("{} is going to be added".format(repository.__str__(True)), vrb)
 
-            if not any(t.get_name() == repository.get_name() for t in cfg.get_tools()):
+            if not cfg.has_tool(repository.get_name()):
                 cfg.add_tool(repository)
                 msg.Prints.success("{} successfully added".format(repository.get_name()))
 
@@ -154,34 +183,69 @@ def scan(ctx: click.core.Context, root_dir: str) -> None:
 
         msg.Prints.verbose("Configurations saved", vrb)
         msg.Prints.verbose("tman scan execution completed", vrb)
-    sys.exit(0)
 
 
-def _repo_seeker(root_dir: str, repo_list: list) -> None:
+def _repo_seeker(root_dir: str, repo_list: list, stop: threading.Event = None) -> None:
     """
     Search repositories from root_dir.
     NOTE: THIS FUNCTION IS CALLED WITHIN A THREAD
 
     :param str root_dir: root directory where to start the scan
-    :param list repo_list: repository list to populate
+    :param list repo_list: repository list to populate with (path, name) tuples
+    :param threading.Event stop: event that, once set, interrupts the scan
     :return: None
     """
-    pattern = ".git"
+    stack = [root_dir]
+
+    while stack:
+        if stop is not None and stop.is_set():
+            return
+
+        current_dir = stack.pop()
+        is_repo, subdirs = _scan_dir(current_dir)
+        if is_repo:
+            repo_list.append((current_dir, os.path.basename(current_dir)))
+
+        # Keep the top-down order of the previous os.walk based scan
+        stack.extend(reversed(subdirs))
+
+
+def _scan_dir(directory: str) -> tuple:
+    """
+    Open directory once, telling whether it contains a .git directory and which subdirectories should be visited.
+    .git and _skipped_dirs directories are never visited, unreadable directories are reported as empty.
+
+    :param str directory: directory to scan
+    :return tuple: (True if directory is a repository, list of subdirectories paths)
+    """
+    is_repo = False
+    subdirs = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                except OSError:
+                    continue
+
+                if entry.name == ".git":
+                    is_repo = True
+                elif entry.name not in _skipped_dirs:
+                    subdirs.append(entry.path)
+    except OSError:
+        pass
 
-    for root, dirs, file in os.walk(root_dir):
-        for d in dirs:
-            if fnmatch.fnmatch(d, pattern):
-                repo_list.append(root)
+    return is_repo, subdirs
 
 
-def _animated_loading() -> None:
+def _animated_loading(char: str) -> None:
     """
     Print a loading statement while searching for repositories.
 
+    :param str char: spinner frame to print
     :return: None
     """
-    chars = "/—\\|"
-    for char in chars:
-        sys.stdout.write("\r" + char + " searching...")
-        time.sleep(.1)
-        sys.stdout.flush()
+    sys.stdout.write("\r" + char + " searching...")
+    sys.stdout.flush()
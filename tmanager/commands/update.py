@@ -2,13 +2,17 @@ import click
 import sys
 import tmanager.utilities.commands as utl_cmds
 import tmanager.core.messages.messages as msg
+from tmanager.core.tool.repository.repository import Repository
 
 CMD_NAME = "update"
 
+# Number of repositories pulled at the same time, git pull is bound to the network
+_MAX_UPDATERS = 8
+
 
 @click.command()
-@click.option("-n", "--name", help="Update tool by name.", metavar="<tool-name>")
-@click.option("-u", "--repo-url", help="Update tool by url.", metavar="<url>")
+@click.option("-n", "--name", help="Update tool by name (exact match).", metavar="<tool-name>")
+@click.option("-u", "--repo-url", help="Update tool by url (exact match).", metavar="<url>")
 @click.option("-a", "--all", is_flag=True, help="Update every registered tool.")
 @click.option("-l", "--log", help="Log to file instead of printing to stdout.", metavar="<filename>")
 @click.option("-y", "--assume-yes", is_flag=True, help="Assume yes.")
@@ -53,13 +57,20 @@ def update(ctx: click.core.Context, name: str, repo_url: str, all: bool, log: st
 
     tot_updated = 0
     updated = []
-    for repo in repos:
+    dirty = False
+
+    # Start pulling every installed repo, results are then reported in the original order
+    installed = [repo.is_installed() for repo in repos]
+    results = Repository.update_many([repo for repo, is_installed in zip(repos, installed) if is_installed],
+                                     _MAX_UPDATERS)
+
+    for repo, is_installed in zip(repos, installed):
         # skip repo that are not installed
-        if not repo.is_installed():
+        if not is_installed:
             if not all:
                 msg.Prints.warning("'{}' is not installed.".format(repo.get_name()), log_fname, CMD_NAME)
             continue
-        res = repo.update()
+        res = next(results)
         # already up-to-date
         if res == 1:
             if not all:
@@ -67,10 +78,13 @@ def update(ctx: click.core.Context, name: str, repo_url: str, all: bool, log: st
         # updated successfully
         elif res == 0:
             tot_updated += 1
+            cfg.update_tool(repo)
+            dirty = True
             repo_name = repo.get_name()
             updated.append(repo_name)
             if not all:
-                msg.Prints.info("Tool '{}' updated successfully.".format(repo_name), log_fname, CMD_NAME, icon=False)
+                msg.Prints.info("Tool '{}' updated successfully.".format(repo_name), log_fname, CMD_NAME,
+                                icon=False)
         elif res == 5:
             msg.Prints.info("No need to update localfile '{}'".format(repo.get_directory()), log_fname, CMD_NAME,
                             icon=False)
@@ -79,5 +93,6 @@ def update(ctx: click.core.Context, name: str, repo_url: str, all: bool, log: st
         msg.Prints.info("Updated {}{}/{} repos".format("" if len(updated) == 0 else "{}, ".format(str(updated)),
                                                        tot_updated, len(repos)), log_fname, CMD_NAME, icon=False)
 
-    cfg.save()
-    sys.exit(0)
+    # Write the configuration only if some repo has actually been updated
+    if dirty:
+        cfg.save()
@@ -1,5 +1,8 @@
 import os
 import json
+import bisect
+import hashlib
+import typing
 import click
 import tmanager.core.messages.messages as msg
 from tmanager.core.tool.tool import Tool
@@ -7,6 +10,9 @@ from tmanager.core.tool.repository.repository import Repository
 from tmanager.core.tool.localfile.localfile import LocalFile
 import tmanager.utilities.file_system as utl_fs
 
+# Number of repositories cloned at the same time by auto_install
+_MAX_CLONES = 8
+
 
 class Config(dict):
     """Config class to manage tman configurations"""
@@ -25,8 +31,17 @@ class Config(dict):
         self.config_dir = tman_config_path
         self.config_file = tman_config_file
 
+        # Digest of the configuration file content as last read or written, save() skips unchanged writes
+        self._saved_digest = None
+
         super(Config, self).__init__(*args, **kwargs)
 
+        # Lookup indexes over the managed tools, kept in sync by add_tool/remove_tool
+        self._by_name = {}
+        self._by_directory = {}
+        self._sorted_dirs = {}
+        self._build_indexes()
+
     def load(self, importing: bool = None) -> int:
         """
         Load tman configurations.
@@ -38,16 +53,25 @@ class Config(dict):
         if not os.path.isdir(self.config_dir) and importing is True:
             return 1
 
-        cfg = None
-        try:
-            cfg = open(self.config_file, "r")
-        except FileNotFoundError:
+        if not os.path.isfile(self.config_file):
             self.first_configuration()
-            cfg = open(self.config_file, "r")
-        finally:
-            configs = cfg.read()
-            cfg.close()
-            self.update(json.loads(configs))
+
+        with open(self.config_file, "rb") as cfg:
+            content = cfg.read()
+
+        # Refuse binary or malformed content with a clear message instead of a decoder traceback
+        try:
+            configs = json.loads(content)
+        except ValueError:
+            configs = None
+
+        if not isinstance(configs, dict):
+            raise click.ClickException(msg.Echoes.error("{} is not a valid tman configuration file"
+                                                        .format(self.config_file)))
+
+        self.update(configs)
+        self._build_indexes()
+        self._saved_digest = hashlib.sha256(content).digest()
 
         return 0
 
@@ -57,11 +81,20 @@ class Config(dict):
 
         :return: None
         """
+        # Encode the configuration once: the same bytes are both hashed and written
+        content = json.dumps(self, separators=(",", ":")).encode()
+
+        # Nothing changed since the configuration file was last read or written
+        digest = hashlib.sha256(content).digest()
+        if digest == self._saved_digest and os.path.isfile(self.config_file):
+            return
+
         if not os.path.isdir(self.config_dir):
             os.makedirs(self.config_dir)
 
-        with open(self.config_file, "w") as cfg:
-            cfg.write(json.dumps(self))
+        with open(self.config_file, "wb") as cfg:
+            cfg.write(content)
+        self._saved_digest = digest
 
     def is_empty(self) -> bool:
         """
@@ -79,6 +112,71 @@ class Config(dict):
         :return: None
         """
         self["tools"] = []
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """
+        Build the name and directory indexes of the managed tools.
+
+        :return: None
+        """
+        self._by_name = {}
+        self._by_directory = {}
+        self._sorted_dirs = {"git": [], "local": []}
+
+        for tool in self.get("tools", []):
+            self._index_tool(tool)
+
+    def _index_tool(self, tool: dict) -> None:
+        """
+        Add a tool to the lookup indexes.
+
+        :param dict tool: tool as dict
+        :return: None
+        """
+        self._by_name[tool["name"]] = tool
+        self._by_directory[tool["directory"]] = tool
+        bisect.insort(self._sorted_dirs.setdefault(tool["type"], []), tool["directory"])
+
+    def _unindex_tool(self, tool: dict) -> None:
+        """
+        Remove a tool from the lookup indexes.
+
+        :param dict tool: tool as dict
+        :return: None
+        """
+        if self._by_name.get(tool["name"]) == tool:
+            del self._by_name[tool["name"]]
+        if self._by_directory.get(tool["directory"]) == tool:
+            del self._by_directory[tool["directory"]]
+
+        dirs = self._sorted_dirs.get(tool["type"], [])
+        i = bisect.bisect_left(dirs, tool["directory"])
+        if i < len(dirs) and dirs[i] == tool["directory"]:
+            del dirs[i]
+
+    @staticmethod
+    def _to_tool(tool: dict) -> Tool:
+        """
+        Instantiate the Tool represented by the given dict.
+
+        :param dict tool: tool as dict
+        :return Tool: Repository or LocalFile
+        """
+        if tool["url"] != "-":
+            return Repository(
+                tool["url"],
+                tool["directory"],
+                name=tool["name"],
+                tags=tool["tags"],
+                add_date=tool["add_date"],
+                install_date=tool["install_date"],
+                last_update_date=tool["last_update_date"])
+
+        return LocalFile(
+            tool["directory"],
+            tags=tool["tags"],
+            add_date=tool["add_date"])
 
     def get_tools(self, repo_only: bool = False) -> list:
         """
@@ -87,32 +185,21 @@ class Config(dict):
         :param repo_only: should extract only repositories?
         :return list: tool list
         """
-        tools = []
+        return list(self._iter_tools(repo_only))
 
-        for tool in self["tools"]:
-            if tool["url"] != "-":
-                res_tool = Repository(
-                    tool["url"],
-                    tool["directory"],
-                    name=tool["name"],
-                    tags=tool["tags"],
-                    add_date=tool["add_date"],
-                    install_date=tool["install_date"],
-                    last_update_date=tool["last_update_date"])
-            else:
-                res_tool = LocalFile(
-                    tool["directory"],
-                    tags=tool["tags"],
-                    add_date=tool["add_date"])
-
-            if res_tool:
-                # Skip local files if the repo_only is True
-                if repo_only and res_tool.is_localfile():
-                    continue
+    def _iter_tools(self, repo_only: bool = False) -> typing.Iterator[Tool]:
+        """
+        Yield the managed Tools one at a time, building each one only when it's reached.
 
-                tools.append(res_tool)
+        :param repo_only: should extract only repositories?
+        :return Iterator[Tool]: tool iterator
+        """
+        for tool in self["tools"]:
+            # Skip local files if the repo_only is True, without building them
+            if repo_only and tool["url"] == "-":
+                continue
 
-        return tools
+            yield self._to_tool(tool)
 
     def already_managed(self, tool: Tool) -> bool:
         """
@@ -121,16 +208,57 @@ class Config(dict):
         :param Tool tool: tool to check
         :return bool: True if it is, otherwise it returns False
         """
-        for t in self.get_tools():
-            if tool.get_name() == t.get_name():
+        if tool.get_name() in self._by_name:
+            return True
+
+        # Check if it's a subdirectory of a managed tool, walking up its parent directories
+        directory = tool.get_directory().rstrip("/")
+        while directory:
+            managed = self._by_directory.get(directory)
+            if managed is not None and os.path.isdir(managed["directory"]):
                 return True
-            # Check if it's a subdirectory of a managed tool
-            elif os.path.isdir(t.get_directory()):
-                if tool.get_directory().startswith(t.get_directory()):
-                    return True
+
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
 
         return False
 
+    def get_tools_under(self, directory: str, _type: str = None) -> list:
+        """
+        Returns every managed Tool located in the given directory,
+        or the tool whose directory is the given one.
+
+        :param str directory: parent directory
+        :param str _type: restrict the search to "git" or "local" tools
+        :return list: tool list
+        """
+        # Match whole path components only: /opt/tool must not match /opt/tool2
+        directory = directory.rstrip("/")
+        prefix = directory + "/"
+
+        tools = []
+        for t in [_type] if _type else self._sorted_dirs:
+            dirs = self._sorted_dirs.get(t, [])
+
+            # The directory itself
+            i = bisect.bisect_left(dirs, directory)
+            matches = dirs[i:bisect.bisect_right(dirs, directory)]
+
+            # Directories sharing the same prefix are contiguous once sorted
+            i = bisect.bisect_left(dirs, prefix)
+            while i < len(dirs) and dirs[i].startswith(prefix):
+                matches.append(dirs[i])
+                i += 1
+
+            for d in matches:
+                tool = self._by_directory.get(d)
+                if tool is not None:
+                    tools.append(self._to_tool(tool))
+
+        return tools
+
     def get_tool(self, tool_name: str) -> Tool or None:
         """
         Return a Tool by name.
@@ -138,11 +266,8 @@ class Config(dict):
         :param str tool_name: tool name to find
         :return Tool|None: found tool or None
         """
-        for tool in self.get_tools():
-            if tool.get_name() == tool_name:
-                return tool
-
-        return None
+        tool = self._by_name.get(tool_name)
+        return self._to_tool(tool) if tool is not None else None
 
     def add_tool(self, tool: Tool) -> None:
         """
@@ -151,7 +276,9 @@ class Config(dict):
         :param Tool tool: repository to add
         :return: None
         """
-        self["tools"].append(tool.__dict__())
+        tool = tool.to_dict()
+        self["tools"].append(tool)
+        self._index_tool(tool)
 
     def update_tool(self, tool: Tool) -> None:
         """
@@ -160,10 +287,15 @@ class Config(dict):
         :param Tool tool: tool to update
         :return: None
         """
-        for t in self.get_tools():
-            if t.get_name() == tool.get_name():
-                self.remove_tool(t)
-                self.add_tool(tool)
+        stored = self._by_name.get(tool.get_name())
+        if stored is None:
+            return
+
+        # Rewrite the stored dict in place: it keeps its position in the tool list and no Tool gets rebuilt
+        self._unindex_tool(stored)
+        stored.clear()
+        stored.update(tool.to_dict())
+        self._index_tool(stored)
 
     def remove_tool(self, tool: Tool) -> None:
         """
@@ -172,7 +304,39 @@ class Config(dict):
         :param Tool tool: tool to remove
         :return: None
         """
-        self["tools"].remove(tool.__dict__())
+        tool = tool.to_dict()
+
+        # Remove the stored dict itself when indexed, list.remove() then matches it by identity
+        stored = self._by_name.get(tool["name"])
+        if stored == tool:
+            tool = stored
+
+        self["tools"].remove(tool)
+        self._unindex_tool(tool)
+
+    def remove_tools(self, tools: list) -> list:
+        """
+        Remove several tools at once, walking the tool list a single time.
+
+        :param list tools: tools to remove
+        :return list: removed tools
+        """
+        to_remove = {}
+        for tool in tools:
+            tool = tool.to_dict()
+            to_remove[tool["name"]] = tool
+
+        kept = []
+        removed = []
+        for tool in self["tools"]:
+            if to_remove.get(tool["name"]) == tool:
+                removed.append(tool)
+                self._unindex_tool(tool)
+            else:
+                kept.append(tool)
+        self["tools"] = kept
+
+        return [self._to_tool(tool) for tool in removed]
 
     def remove_all_tools(self) -> int:
         """
@@ -181,7 +345,7 @@ class Config(dict):
         :return int: number of tools removed
         """
         length = len(self["tools"])
-        self["tools"] = []
+        self.initialize_empty_tool_list()
         return length
 
     def auto_install(self) -> None:
@@ -195,13 +359,18 @@ class Config(dict):
         if self.get_automatic_install():
             msg.Prints.info("Installing repositories, this may take a while..", "", "")
             tot = 0
-            for repo in self.get_tools(repo_only=True):
-                if repo.clone() == 0:
+            repos = self.get_tools(repo_only=True)
+
+            # Clone the repositories in parallel, git clone is bound to the network
+            for repo, res in zip(repos, Repository.clone_many(repos, _MAX_CLONES)):
+                if res == 0:
                     tot += 1
                     # Update both the installation date and the last update date
                     repo.update_timestamps()
                     self.update_tool(repo)
-                    self.save()
+
+            if tot:
+                self.save()
             msg.Prints.info("{} repo cloned".format(tot), "", "")
 
     def get_automatic_install(self) -> bool:
@@ -227,10 +396,8 @@ class Config(dict):
 
         :return str|None: default installation directory if exists or None
         """
-        if "default_installation_directory" in self.keys():
-            return utl_fs.trailing_slash(self["default_installation_directory"])
-
-        return None
+        directory = self.get("default_installation_directory")
+        return utl_fs.trailing_slash(directory) if directory is not None else None
 
     def has_tool(self, name: str) -> bool:
         """
@@ -239,12 +406,7 @@ class Config(dict):
         :param name: tool name to search
         :return bool: True if tool is into configuration file, False otherwise
         """
-        tools = self.get_tools()
-        for t in tools:
-            if t.get_name() == name:
-                return True
-
-        return False
+        return name in self._by_name
 
     def set_default_installation_directory(self, new_installation_directory: str) -> None:
         """
@@ -280,7 +442,7 @@ class Config(dict):
 
         self["default_installation_directory"] = default_installation_directory
         self["automatic_install"] = automatic_install
-        self["tools"] = []
+        self.initialize_empty_tool_list()
 
         self.save()
         msg.Prints.success("Configuration file {} has been created successfully".format(self.config_file), "", "")
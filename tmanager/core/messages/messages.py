@@ -1,14 +1,44 @@
+import atexit
 import click
 import datetime
+import threading
 
 _ICON_ALERT = '[!] '
 _ICON_INFO = '[*] '
 _ICON_EMPTY = ''
 
+# Message templates, styled once: click.echo strips the colors when they're not supported
+_ERROR_STYLE = click.style("{}{}", fg="red", bold=True)
+_WARNING_STYLE = click.style("{}{}", fg="yellow", bold=True)
+_SUCCESS_STYLE = click.style("{}{}", fg="green")
+_INFO_STYLE = click.style("{}{}", fg="white")
+_INPUT_STYLE = click.style("{}{}", fg="blue")
+_VERBOSE_STYLE = click.style("{}{}", fg="magenta")
+
 LOG_INFO = "INFO"
 LOG_WARN = "WARN"
 LOG_ERR = "ERROR"
 
+# Log files opened so far, kept open until the interpreter exits
+_log_files = {}
+# Commands log from worker threads too: serialize opening and writing the log files
+_log_lock = threading.Lock()
+
+
+def _close_log_files() -> None:
+    """
+    Flush and close every log file opened by Prints.log_to_file.
+
+    :return: None
+    """
+    with _log_lock:
+        for f in _log_files.values():
+            f.close()
+        _log_files.clear()
+
+
+atexit.register(_close_log_files)
+
 
 class Prints:
 
@@ -26,18 +56,19 @@ class Prints:
         :param msg: the string to log
         :return:
         """
-        now = datetime.datetime.now()
-        date_time = "{}-{}-{} {}:{}:{}".format(now.year, now.month, now.day, now.hour, now.minute, now.second)
+        date_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # compute the logstring  date-cmdname-loglevel-msg
         log_str = "{} | {} | {} | {}\n".format(date_time, cmd_name, log_lvl, msg.replace("\n", "--"))
 
-        # write the string to file
-        with open(log_fname, 'a') as f:
+        # write the string to file, opening it only the first time it's used.
+        # Line buffered: every line reaches the file right away, even if the run gets killed
+        with _log_lock:
+            f = _log_files.get(log_fname)
+            if f is None:
+                f = _log_files[log_fname] = open(log_fname, 'a', buffering=1)
             f.write(log_str)
 
-        pass
-
     @staticmethod
     def error(msg: str, log_fname: str = "", cmd_name: str = "", icon: bool = True) -> None:
         """
@@ -53,7 +84,7 @@ class Prints:
             Prints.log_to_file(log_fname, cmd_name, LOG_ERR, msg)
         else:
             print_icon = _ICON_ALERT if icon else _ICON_EMPTY
-            click.echo(click.style("{}{}".format(print_icon, msg), fg="red", bold=True))
+            click.echo(_ERROR_STYLE.format(print_icon, msg))
 
     @staticmethod
     def warning(msg: str, log_fname: str = "", cmd_name: str = "", icon: bool = True) -> None:
@@ -70,7 +101,7 @@ class Prints:
             Prints.log_to_file(log_fname, cmd_name, LOG_WARN, msg)
         else:
             print_icon = _ICON_INFO if icon else _ICON_EMPTY
-            click.echo(click.style("{}{}".format(print_icon, msg), fg="yellow", bold=True))
+            click.echo(_WARNING_STYLE.format(print_icon, msg))
 
     @staticmethod
     def success(msg: str, log_fname: str = "", cmd_name: str = "", icon: bool = True) -> None:
@@ -87,7 +118,7 @@ class Prints:
             Prints.log_to_file(log_fname, cmd_name, LOG_INFO, msg)
         else:
             print_icon = _ICON_INFO if icon else _ICON_EMPTY
-            click.echo(click.style("{}{}".format(print_icon, msg), fg="green"))
+            click.echo(_SUCCESS_STYLE.format(print_icon, msg))
 
     @staticmethod
     def info(msg: str, log_fname: str = "", cmd_name: str = "", icon: bool = True) -> None:
@@ -104,7 +135,7 @@ class Prints:
             Prints.log_to_file(log_fname, cmd_name, LOG_INFO, msg)
         else:
             print_icon = _ICON_INFO if icon else _ICON_EMPTY
-            click.echo(click.style("{}{}".format(print_icon, msg), fg="white"))
+            click.echo(_INFO_STYLE.format(print_icon, msg))
 
     @staticmethod
     def input(msg: str, icon: bool = True) -> None:
@@ -116,26 +147,32 @@ class Prints:
         :return: None
         """
         print_icon = _ICON_INFO if icon else _ICON_EMPTY
-        click.echo(click.style("{}{}".format(print_icon, msg), fg="blue"))
+        click.echo(_INPUT_STYLE.format(print_icon, msg))
 
     @staticmethod
-    def verbose(msg: str, verbose: bool, log_fname: str = "", cmd_name: str = "", icon: bool = True) -> None:
+    def verbose(msg: str, verbose: bool, log_fname: str = "", cmd_name: str = "", icon: bool = True,
+                fmt_args: tuple = ()) -> None:
         """
         Print verbose messages.
+        If fmt_args is given, msg is formatted with it only when the message is actually printed.
 
         :param str msg: message to print
         :param bool verbose: should print the message?
         :param str log_fname: log filename
         :param str cmd_name: command name
         :param bool icon: should show message icon
+        :param tuple fmt_args: arguments msg is formatted with
         :return: None
         """
         if verbose:
+            if fmt_args:
+                msg = msg.format(*fmt_args)
+
             if log_fname:
                 Prints.log_to_file(log_fname, cmd_name, LOG_INFO, msg)
             else:
                 print_icon = _ICON_INFO if icon else _ICON_EMPTY
-                click.echo(click.style("{}{}".format(print_icon, msg), fg="magenta"))
+                click.echo(_VERBOSE_STYLE.format(print_icon, msg))
 
 
 class Echoes:
@@ -149,7 +186,7 @@ class Echoes:
         :return str: colored error message
         """
         print_icon = _ICON_ALERT if icon else _ICON_EMPTY
-        return click.style("{}{}".format(print_icon, msg), fg="red", bold=True)
+        return _ERROR_STYLE.format(print_icon, msg)
 
     @staticmethod
     def info(msg: str, icon: bool = True) -> str:
@@ -161,7 +198,7 @@ class Echoes:
         :return str: colored info message
         """
         print_icon = _ICON_INFO if icon else _ICON_EMPTY
-        return click.style("{}{}".format(print_icon, msg), fg="white")
+        return _INFO_STYLE.format(print_icon, msg)
 
     @staticmethod
     def input(msg: str, icon: bool = True) -> str:
@@ -173,7 +210,7 @@ class Echoes:
         :return str: colored input message
         """
         print_icon = _ICON_INFO if icon else _ICON_EMPTY
-        return click.style("{}{}".format(print_icon, msg), fg="blue")
+        return _INPUT_STYLE.format(print_icon, msg)
 
     @staticmethod
     def success(msg: str, icon: bool = True) -> str:
@@ -185,7 +222,7 @@ class Echoes:
         :return str: colored success message
         """
         print_icon = _ICON_INFO if icon else _ICON_EMPTY
-        return click.style("{}{}".format(print_icon, msg), fg="green")
+        return _SUCCESS_STYLE.format(print_icon, msg)
 
     @staticmethod
     def verbose(msg: str, verbose: bool, icon: bool = True) -> str:
@@ -199,7 +236,7 @@ class Echoes:
         """
         if verbose:
             print_icon = _ICON_INFO if icon else _ICON_EMPTY
-            return click.style("{}{}".format(print_icon, msg), fg="magenta")
+            return _VERBOSE_STYLE.format(print_icon, msg)
 
     @staticmethod
     def warning(msg: str, icon: bool = True) -> str:
@@ -211,4 +248,4 @@ class Echoes:
         :return str: colored warning message
         """
         print_icon = _ICON_INFO if icon else _ICON_EMPTY
-        return click.style("{}{}".format(print_icon, msg), fg="yellow", bold=True)
+        return _WARNING_STYLE.format(print_icon, msg)
@@ -5,6 +5,8 @@ import tmanager.utilities.dates as utl_dates
 class LocalFile(Tool):
     """Repository class to manage tman repository"""
 
+    __slots__ = ()
+
     def __init__(self,
                  pathname: str,
                  directory: str = None,
@@ -56,14 +58,11 @@ class LocalFile(Tool):
 
         :return: local file as str
         """
-        tool_desc = "\n"
-        tool_desc += "name: {}\n".format(self.get_name())
-        tool_desc += "tags: {}\n".format(self.get_tags())
-        tool_desc += "type: {}\n".format(self.get_type())
-        tool_desc += "directory: {}\n".format(self.get_directory()) if verbose else "directory: {}".format(
-            self.get_directory())
-        if verbose:
-            tool_desc += "add date: {}\n".format("" if self.get_add_date() is None else utl_dates.time_to_ctime(
-                self.get_add_date()))
+        if not verbose:
+            return "\nname: {}\ntags: {}\ntype: {}\ndirectory: {}".format(
+                self._name, self._tags, self._type, self._directory)
+
+        add_date = "" if self._add_date is None else utl_dates.time_to_ctime(self._add_date)
 
-        return tool_desc
+        return "\nname: {}\ntags: {}\ntype: {}\ndirectory: {}\nadd date: {}\n".format(
+            self._name, self._tags, self._type, self._directory, add_date)
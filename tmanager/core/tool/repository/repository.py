@@ -1,12 +1,16 @@
-import git
 import tmanager.utilities.dates as utl_dates
+import concurrent.futures
 import os
+import subprocess
+import typing
 from tmanager.core.tool.tool import Tool
 
 
 class Repository(Tool):
     """Repository class to manage tman repository"""
 
+    __slots__ = ()
+
     def __init__(self,
                  url: str,
                  directory: str,
@@ -32,14 +36,14 @@ class Repository(Tool):
             url += ".git"
 
         # Set the name is if it's None
-        name = name or url.split("/")[-1][:-4]
+        name = name or url.rsplit("/", 1)[-1][:-4]
 
         # Set the type
         _type = "git"
 
         # Set the installation directory
         if not directory.endswith(name):
-            directory = "{dir}{s}{name}".format(dir=directory, s=("" if directory.endswith("/") else "/"), name=name)
+            directory = os.path.join(directory, name)
 
         super().__init__(
             url,
@@ -59,35 +63,29 @@ class Repository(Tool):
         :param bool verbose: show all fields
         :return: repository as str
         """
-        tool_desc = "\n"
-        tool_desc += "name: {}\n".format(self.get_name())
-        if verbose:
-            tool_desc += "url: {}\n".format(self.get_url())
-
-        tool_desc += "tags: {}\n".format(self.get_tags() if self.get_tags() else "[]")
-        tool_desc += "type: {}\n".format(self.get_type())
-        tool_desc += "directory: {}\n".format(self.get_directory())
+        last_update = "not installed" if self._last_update_date is None else utl_dates.time_to_ctime(
+            self._last_update_date)
 
-        if verbose:
-            tool_desc += "add date: {}\n".format("" if self.get_add_date() is None else utl_dates
-                                                 .time_to_ctime(self.get_add_date()))
-            tool_desc += "installation date: {}\n" \
-                .format("not installed" if self.get_install_date() is None else utl_dates
-                        .time_to_ctime(self.get_install_date()))
+        if not verbose:
+            return "\nname: {}\ntags: {}\ntype: {}\ndirectory: {}\nlast update: {}".format(
+                self._name, self._tags or "[]", self._type, self._directory, last_update)
 
-        tool_desc += "last update: {}" \
-            .format("not installed" if self.get_last_update_date() is None else utl_dates
-                    .time_to_ctime(self.get_last_update_date()))
+        add_date = "" if self._add_date is None else utl_dates.time_to_ctime(self._add_date)
+        install_date = "not installed" if self._install_date is None else utl_dates.time_to_ctime(self._install_date)
 
-        return tool_desc
+        return "\nname: {}\nurl: {}\ntags: {}\ntype: {}\ndirectory: {}\nadd date: {}\ninstallation date: {}\n" \
+               "last update: {}".format(self._name, self._url, self._tags or "[]", self._type, self._directory,
+                                        add_date, install_date, last_update)
 
-    def clone(self) -> int:
+    def clone(self, full_history: bool = False) -> int:
         """
-        Clone repository into path
+        Clone repository into path.
+        By default only the latest commit of the default branch is fetched.
 
+        :param bool full_history: clone the whole history of every branch
         :return: int error code
         """
-        return self._perform("clone")
+        return self._perform("clone", full_history)
 
     def update(self) -> int:
         """
@@ -97,56 +95,120 @@ class Repository(Tool):
         """
         return self._perform("pull")
 
-    def _perform(self, func: str) -> int:
+    @classmethod
+    def clone_many(cls, repos: list, workers: int = 8) -> typing.Iterator[int]:
+        """
+        Clone several repositories at once, in parallel since git clone is bound to the network.
+        Status codes are yielded in the same order as repos, as soon as each one is available.
+
+        :param list repos: repositories to clone
+        :param int workers: maximum number of concurrent clones
+        :return Iterator[int]: clone() error code of every repository
+        """
+        return _run_many(cls.clone, repos, workers)
+
+    @classmethod
+    def update_many(cls, repos: list, workers: int = 8) -> typing.Iterator[int]:
         """
-        - GitPython errors: https://gitpython.readthedocs.io/en/stable/reference.html#module-git.exc
-        Clone or update
+        Update several repositories at once, pulling them in parallel since git pull is bound to the network.
+        Status codes are yielded in the same order as repos, as soon as each one is available.
+
+        :param list repos: repositories to update
+        :param int workers: maximum number of concurrent pulls
+        :return Iterator[int]: update() error code of every repository
+        """
+        return _run_many(cls.update, repos, workers)
+
+    def _is_upstream_checked_out(self) -> bool:
+        """
+        Check whether the upstream branch of the checked out branch, on the remote, is the commit already checked out.
+        Asking the remote for a single ref takes one round-trip, without fetching anything.
+
+        :return bool: True if there's nothing to pull, False if it can't be told (e.g. detached HEAD, no upstream)
+        """
+        directory = self.get_directory()
+        try:
+            # Current branch (marked with '*'), its commit, and the remote branch it pulls from
+            local = subprocess.run(["git", "-C", directory, "for-each-ref", "refs/heads",
+                                    "--format=%(HEAD) %(objectname) %(upstream:remotename) %(upstream:remoteref)"],
+                                   capture_output=True, text=True, check=False)
+            if local.returncode != 0:
+                return False
+
+            current = next((line.split() for line in local.stdout.splitlines() if line.startswith("* ")), None)
+            if current is None or len(current) != 4:
+                return False
+            _, local_sha, remote, remote_ref = current
+
+            remote_refs = subprocess.run(["git", "-C", directory, "ls-remote", "--", remote, remote_ref],
+                                         capture_output=True, text=True, check=False)
+        except OSError:
+            return False
+
+        if remote_refs.returncode != 0:
+            return False
+
+        # ls-remote matches patterns against the tail of the refs: keep the exact one only
+        return any(line.split("\t") == [local_sha, remote_ref] for line in remote_refs.stdout.splitlines())
+
+    def _perform(self, func: str, full_history: bool = False) -> int:
+        """
+        Clone or update, running git directly
 
         It returns:
             0 on success
             1 if the repo is already up to date (pull)
-            2 if the destination directory already exists when cloning (clone)
+            2 if the destination directory already exists when cloning (clone), or if git failed
             .. TODO ..
 
         :param str func: function to perform
+        :param bool full_history: clone the whole history of every branch (clone)
         :return: int status code
         """
+        if func == "clone":
+            if os.path.isdir(self.get_directory()):                 # check if the repo's directory already exists
+                return 2
+            # if it doesn't exist, then attempt to clone it: tools only need the latest snapshot, not the history
+            args = ["git", "clone"]
+            if not full_history:
+                args += ["--depth", "1", "--single-branch"]
+            args += ["--", self.get_url(), self.get_directory()]
+
+        elif func == "pull":
+            # a pull always fetches and merges: skip it when the upstream branch hasn't moved
+            if self._is_upstream_checked_out():
+                return 1
+            args = ["git", "-C", self.get_directory(), "pull"]
+
         try:
-            if func == "clone":
-                if os.path.isdir(self.get_directory()):             # check if the repo's directory already exists
-                    return 2
-                git.Repo.clone_from(self.get_url(),
-                                    self.get_directory())  # if it doesn't exist, then attempt to clone it
-
-            elif func == "pull":
-                repo = git.cmd.Git(self.get_directory())
-                r = repo.pull()
-                if r.startswith("Already up"):
-                    return 1
-
-        except git.exc.CheckoutError:
-            return 1
-        except git.exc.CommandError:
+            r = subprocess.run(args, capture_output=True, text=True, check=False)
+        except OSError:
+            # git is not installed or not in PATH
             return 2
-        except git.exc.GitCommandError:
-            return 3
-        except git.exc.GitCommandNotFound:
-            return 4
-        except git.exc.HookExecutionError:
-            return 5
-        except git.exc.InvalidGitRepositoryError:
-            return 6
-        except git.exc.NoSuchPathError:
-            return 7
-        except git.exc.RepositoryDirtyError:
-            return 8
-        except git.exc.UnmergedEntriesError:
-            return 9
-        except git.exc.WorkTreeRepositoryUnsupported:
-            return 10
-        except git.exc.GitError:
-            return 11
+
+        if r.returncode != 0:
+            return 2
+        if func == "pull" and r.stdout.startswith("Already up"):
+            return 1
 
         # everything went fine, modify the last_update_date
-        self.last_update_date = utl_dates.now()
+        self.set_last_update_date(utl_dates.now())
         return 0
+
+
+def _run_many(func: typing.Callable, repos: list, workers: int) -> typing.Iterator[int]:
+    """
+    Run func on every repository, yielding the results in the same order as repos.
+    A single repository is handled in the calling thread, as a pool would only add overhead.
+
+    :param Callable func: Repository method to run
+    :param list repos: repositories
+    :param int workers: maximum number of concurrent threads
+    :return Iterator[int]: func() error code of every repository
+    """
+    if len(repos) <= 1:
+        yield from map(func, repos)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(repos))) as executor:
+        yield from executor.map(func, repos)
@@ -7,6 +7,10 @@ class Tool:
         Repository class to manage tman repository
     """
 
+    # Tools are plenty and short-lived: fixed slots instead of a per-instance dict
+    __slots__ = ("_url", "_directory", "_name", "_type", "_tags", "_tags_lower", "_add_date", "_install_date",
+                 "_last_update_date")
+
     def __init__(self,
                  url: str,
                  directory: str,
@@ -33,11 +37,12 @@ class Tool:
         self._name = name
         self._type = _type
         self._tags = tags
+        self._tags_lower = None
         self._add_date = add_date
         self._install_date = install_date
         self._last_update_date = last_update_date
 
-    def __dict__(self) -> dict:
+    def to_dict(self) -> dict:
         """
         Return tool as dict.
 
@@ -61,7 +66,18 @@ class Tool:
         :param Tool other: other Tool to check
         :return bool: True if self == other, False otherwise
         """
-        return self.get_name() == other.get_name()
+        if not isinstance(other, Tool):
+            return NotImplemented
+        return self._name == other._name
+
+    def __hash__(self) -> int:
+        """
+        Hash the tool by name, consistently with __eq__, so tools can be kept in sets and used as dict keys.
+        Don't rename a tool while it's in a set or a dict.
+
+        :return int: tool hash
+        """
+        return hash(self._name)
 
     def is_localfile(self) -> bool:
         """
@@ -79,6 +95,48 @@ class Tool:
         """
         return self._type == "git"
 
+    # READ-ONLY PROPERTIES
+    # Plain attribute reads for hot loops (e.g. find_tool), changes still go through the setters
+    @property
+    def url(self) -> str:
+        """Tool url"""
+        return self._url
+
+    @property
+    def directory(self) -> str:
+        """Tool directory"""
+        return self._directory
+
+    @property
+    def name(self) -> str:
+        """Tool name"""
+        return self._name
+
+    @property
+    def type(self) -> str:
+        """Tool type"""
+        return self._type
+
+    @property
+    def tags(self) -> list:
+        """Tool tags"""
+        return self._tags
+
+    @property
+    def add_date(self) -> float:
+        """Tool add date"""
+        return self._add_date
+
+    @property
+    def install_date(self) -> float:
+        """Tool install date"""
+        return self._install_date
+
+    @property
+    def last_update_date(self) -> float:
+        """Tool last update date"""
+        return self._last_update_date
+
     # GETTER & SETTER
     # URL
     def get_url(self) -> str:
@@ -164,6 +222,16 @@ class Tool:
         """
         return self._tags
 
+    def get_tags_lower(self) -> frozenset:
+        """
+        Get tool tags in lowercase, computed once and reused until the tags are set again
+
+        :return: lowercase tool tags
+        """
+        if self._tags_lower is None:
+            self._tags_lower = frozenset(t.lower() for t in self._tags or ())
+        return self._tags_lower
+
     def set_tags(self, new_tags: list) -> None:
         """
         Set new tags
@@ -172,6 +240,7 @@ class Tool:
         :return: None
         """
         self._tags = new_tags
+        self._tags_lower = None
 
     # ADD DATE
     def get_add_date(self) -> float:
@@ -1,22 +1,56 @@
 #!/usr/bin/env python3
 import click
 from tmanager import __version__, __name_desc__
-from tmanager.core.config.config import Config
-from tmanager.commands.add import add
-from tmanager.commands.install import install
-from tmanager.commands.update import update
-from tmanager.commands.find import find
-from tmanager.commands.config import config
-from tmanager.commands.delete import delete
-from tmanager.commands.modify import modify
-from tmanager.commands.scan import scan
-from tmanager.commands.export_conf import export_conf
-from tmanager.commands.import_conf import import_conf
+import importlib
+
+# Command name -> "module:attribute", every command module is imported only when its command is needed
+_commands = {
+    "add": "tmanager.commands.add:add",
+    "config": "tmanager.commands.config:config",
+    "delete": "tmanager.commands.delete:delete",
+    "export-conf": "tmanager.commands.export_conf:export_conf",
+    "find": "tmanager.commands.find:find",
+    "import-conf": "tmanager.commands.import_conf:import_conf",
+    "install": "tmanager.commands.install:install",
+    "modify": "tmanager.commands.modify:modify",
+    "scan": "tmanager.commands.scan:scan",
+    "update": "tmanager.commands.update:update",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports the module of a command only when the command is requested"""
+
+    def list_commands(self, ctx: click.core.Context) -> list:
+        """
+        List the names of every command, without importing them
+
+        :param click.core.Context ctx: click context
+        :return list: sorted command names
+        """
+        return sorted(set(super().list_commands(ctx)) | _commands.keys())
+
+    def get_command(self, ctx: click.core.Context, cmd_name: str) -> click.Command:
+        """
+        Get a command, importing its module on first use
+
+        :param click.core.Context ctx: click context
+        :param str cmd_name: command name
+        :return click.Command: the command, None if there's no such command
+        """
+        if cmd_name in self.commands or cmd_name not in _commands:
+            return super().get_command(ctx, cmd_name)
+
+        module_name, attr = _commands[cmd_name].split(":")
+        cmd = getattr(importlib.import_module(module_name), attr)
+        self.add_command(cmd, cmd_name)
+        return cmd
 
 
 # CLICK COMMANDS
-@click.group(context_settings={'help_option_names': ['-h', '--help']})
+@click.group(cls=LazyGroup, context_settings={'help_option_names': ['-h', '--help']})
 @click.option("-v", "--verbose", is_flag=True, help="Execute command in verbose mode.")
+# --version is eager: it exits before the subcommand gets resolved and before the configuration is loaded
 @click.version_option(__version__, "-V", "--version", prog_name=__name_desc__,)
 @click.pass_context
 def tman(ctx: click.core.Context, verbose: bool) -> None:
@@ -37,26 +71,10 @@ def tman(ctx: click.core.Context, verbose: bool) -> None:
     # Check that context object type is dict
     ctx.ensure_object(dict)
 
-    # Add config object and verbose flag to context
-    cfg = Config()
-    cfg.load()
-    ctx.obj["configurations"] = cfg
+    # Add verbose flag to context, the configuration is loaded by the first command that needs it
     ctx.obj["verbose"] = verbose
 
 
-# Add tman commands
-tman.add_command(add)
-tman.add_command(install)
-tman.add_command(update)
-tman.add_command(find)
-tman.add_command(config)
-tman.add_command(delete)
-tman.add_command(modify)
-tman.add_command(scan)
-tman.add_command(import_conf)
-tman.add_command(export_conf)
-
-
 # MAIN
 if __name__ == "__main__":
     tman()
@@ -1,89 +1,88 @@
 import click
+import functools
 import os
+import pwd
+import re
+import stat
 import tmanager.core.messages.messages as msg
-import tmanager.utilities.file_system as utl_fs
-from srblib import abs_path
 from tmanager.core.config.config import Config
 
+# URL prefixes that identify a (possible) git repository
+_GIT_URL_PREFIXES = ("http", "git")
+
+# Tags part of an exported tool line, i.e.: tags-['t1', 't2']
+# (a closing bracket inside a quoted tag doesn't end the list)
+_tags_re = re.compile(r"""tags-\[((?:'[^']*'|"[^"]*"|[^\]'"])*)\]""")
+_whitespace_re = re.compile(r"\s+")
+# Comma-separated token made of digits only, surrounding spaces allowed
+_index_re = re.compile(r"(?:^|,)\s*(\d+)\s*(?=,|$)")
+
 
 def find_tool(cfg: Config, url: str = None, tags: str = None, name: str = None, _type: str = None,
-              last_update_date: str = None, f: bool = False) -> list:
+              last_update_date: str = None, f: bool = False, tools: list = None) -> list:
     """
     Returns the list of Tools that match all the provided input criteria.
 
     :param Config cfg: configurations object
-    :param str url: repository url
+    :param str url: repository url, or a tuple of urls
     :param str tags: repository tags
-    :param str name: repository name
+    :param str name: repository name, or a tuple of names
     :param str _type: repository type
     :param str last_update_date: repository last_update_date
-    :param bool f: flexible find
+    :param bool f: flexible find: names and urls match when they contain the searched ones (case insensitive),
+                   otherwise they must be equal
+    :param list tools: tools to search into, when already retrieved from cfg
     :return list: repositories list
     """
-    found_tools = []
-    tools = cfg.get_tools()
+    if tools is None:
+        tools = cfg.get_tools()
 
     # sanitize tags list
     tags = sanitize_tags(tags)
 
-    if url is not None:
-        url = url if url.endswith(".git") else "{}{}".format(url, ".git")
+    # Either a single name or several ones (find accepts the option multiple times), same goes for urls
+    names = (name,) if isinstance(name, str) else name
+    urls = (url,) if isinstance(url, str) else url
+
+    # Build the filters from the most to the least selective one, so that each filter only goes through the tools
+    # kept by the previous ones
+    filters = []
+    if names:
+        if f:
+            # Flexible find: the tool's name contains any of the names, case insensitive
+            names_lower = [n.lower() for n in names]
+            filters.append(lambda t: any(n in t.name.lower() for n in names_lower))
+        else:
+            names_set = frozenset(names)
+            filters.append(lambda t: t.name in names_set)
+
+    if urls:
+        if f:
+            # Flexible find: the tool's url contains any of the urls, case insensitive
+            urls_lower = [u.rstrip("/").lower() for u in urls]
+            filters.append(lambda t: any(u in t.url.lower() for u in urls_lower))
+        else:
+            # Exact match, urls are stored as repositories normalize them: no trailing slash, ending with .git
+            urls_set = {u.rstrip("/") for u in urls}
+            urls_set = frozenset(u if u.endswith(".git") else "{}.git".format(u) for u in urls_set)
+            filters.append(lambda t: t.url in urls_set)
+
+    if _type:
+        filters.append(lambda t: t.type in _type)
+
+    if last_update_date:
+        # Tool's last_update_date must be >= searched last_update_date
+        filters.append(lambda t: t.last_update_date is not None and t.last_update_date >= last_update_date)
 
-    search_terms = {
-        "url": url,
-        "tags": tags,
-        "name": name,
-        "type": _type,
-        "last_update_date": last_update_date
-    }
+    if tags:
+        # The tool must have all the searched tags
+        tags_lower = frozenset(t.lower() for t in tags)
+        filters.append(lambda t: tags_lower.issubset(t.get_tags_lower()))
 
     # The only tools that are returned are those that match all the search terms
-    for tool in tools:
-        is_url_ok = is_tags_ok = is_name_ok = is_type_ok = is_last_update_date_ok = True
-
-        for key in search_terms:
-            if search_terms[key]:
-                # Check if the tool's url matches the input url
-                if key == "url":
-                    if tool.get_url() not in search_terms["url"]:
-                        is_url_ok = False
-
-                # Check if the tool has any matching tags
-                elif key == "tags":
-                    if not set([x.lower() for x in search_terms["tags"]]).issubset(set(y.lower() for y in
-                                                                                       tool.get_tags())):
-                        is_tags_ok = False
-
-                # Check if the tool's name matches
-                elif key == "name":
-                    toolname = tool.get_name()
-                    # if flexible find flag is set
-                    if f:
-                        found = False
-                        for t in search_terms["name"]:
-                            if toolname.lower() == t.lower() or t.lower() in toolname.lower():
-                                found = True
-                                break
-                        if not found:
-                            is_name_ok = False
-
-                    elif toolname not in search_terms["name"]:
-                        is_name_ok = False
-
-                # Check if the tool's type matches
-                elif key == "type":
-                    if tool.get_type() not in search_terms["type"]:
-                        is_type_ok = False
-
-                # Check if tool's last_update_date is >= searched__last_update_date
-                elif key == "last_update_date":
-                    if tool.get_last_update_date() is None \
-                            or tool.get_last_update_date() < search_terms["last_update_date"]:
-                        is_last_update_date_ok = False
-
-        # If everything is True then add the repository
-        if is_url_ok and is_tags_ok and is_name_ok and is_type_ok and is_last_update_date_ok:
-            found_tools.append(tool)
+    found_tools = list(tools)
+    for keep in filters:
+        found_tools = [t for t in found_tools if keep(t)]
 
     return found_tools
 
@@ -96,16 +95,10 @@ def sanitize_indexes(indexes: list, user_input: str) -> list:
 
     :param list indexes: list of permitted indexes
     :param str user_input: comma-separated list of ind.
-    :return list: list of valid indexes
+    :return list: sorted list of unique valid indexes
     """
-    res = set()
     max_val = len(indexes)
-
-    for index in user_input.split(","):
-        index = index.strip()
-        if index.isdigit() and int(index)-1 < max_val:
-            res.add(int(index)-1)
-    return list(res)
+    return sorted({i - 1 for i in map(int, _index_re.findall(user_input)) if 0 < i <= max_val})
 
 
 def is_git_url(url: str) -> bool:
@@ -118,10 +111,7 @@ def is_git_url(url: str) -> bool:
     :return: True if url could be a git url, False otherwise
     """
     # TODO: make this controls more restrictive
-    if url.startswith("http") or url.startswith("git"):
-        return True
-
-    return False
+    return url.startswith(_GIT_URL_PREFIXES)
 
 
 def sanitize_types(types: str) -> list:
@@ -141,20 +131,23 @@ def sanitize_tags(tags: str) -> list:
     **Note that:
         - tags cannot contain spaces
         - this method might return an empty list
+        - a list of already sanitized tags is returned as it is, not copied
 
     :param str tags: tag string to sanitize
     :return list: sanitized tags
     """
-    valid_tags = []
-    if tags:
-        if type(tags) is not list:
-            tags = tags.split(",")
-        for tag in tags:
-            # remove spaces
-            tag = tag.strip().replace(" ", "")
-            if tag:
-                valid_tags.append(tag)
-    return valid_tags
+    if not tags:
+        return []
+
+    if type(tags) is list:
+        # Already sanitized, e.g. tags coming from the configuration file
+        if all(tag and not _whitespace_re.search(tag) for tag in tags):
+            return tags
+    else:
+        tags = tags.split(",")
+
+    # remove spaces
+    return [tag for tag in (_whitespace_re.sub("", t) for t in tags) if tag]
 
 
 def remove_tags(line: str) -> (str, list):
@@ -166,32 +159,36 @@ def remove_tags(line: str) -> (str, list):
     :param str line:
     :return tuple:
     """
+    m = _tags_re.search(line)
+    if not m:
+        return line, []
+
+    # Tags are quoted, as they're exported as a Python list: remove the enclosing quotes only
     tags = []
-    start = line.find("tags-[")
-    end = -1
-    # Parse each tag
-    for i in range(start, len(line)):
-        if line[i] == "]":
-            end = i
-
-    tag_str = line[start:end + 1]
-    line_without_tags = line.replace(tag_str, "")
-
-    for t in [k.strip()[1:-1] for k in tag_str.split("-", 1)[1][1:-1].split(",")]:
-        if t is not None and t != '':
+    for t in m.group(1).split(","):
+        t = t.strip()
+        if len(t) > 1 and t[0] == t[-1] and t[0] in "'\"":
+            t = t[1:-1]
+        if t:
             tags.append(t)
+    line_without_tags = _tags_re.sub("", line, count=1)
 
     return line_without_tags, tags
 
 
 def get_configs_from_context(ctx: click.core.Context) -> Config:
     """
-    Return configuration object from context
+    Return configuration object from context, loading it on first use
 
     :param click.core.Context ctx: click context
     :return Config: configuration
     """
-    return ctx.obj["configurations"]
+    cfg = ctx.obj.get("configurations")
+    if cfg is None:
+        cfg = Config()
+        cfg.load()
+        ctx.obj["configurations"] = cfg
+    return cfg
 
 
 def get_verbose_from_context(ctx: click.core.Context) -> bool:
@@ -241,15 +238,23 @@ def validate_log_filename(filename: str, cmd_name: str, assume_yes: bool = False
     :param bool assume_yes: overwrite the input file without asking the user
     :return:
     """
+    from srblib import abs_path
+
     log_fname = ""
 
+    # Stat the file just once, None if it doesn't exist
+    try:
+        st = os.stat(filename)
+    except OSError:
+        st = None
+
     # if it's a writable file then retrieve the logfile absolute pathname
-    if utl_fs.is_writable(filename) and os.path.isfile(filename):
+    if st is not None and stat.S_ISREG(st.st_mode) and os.access(filename, os.W_OK):
         if not assume_yes and not click.confirm("'{}' exists, overwrite?".format(filename)):
             return log_fname
         log_fname = abs_path(filename)
     # if it's not writable or it doesn't exist or it's a directory, then quit
-    elif os.path.exists(filename):
+    elif st is not None:
         msg.Prints.warning("file {} doesn't exist or it's not writable".format(filename), log_fname, cmd_name)
         return log_fname
     # attempt to create the new log file
@@ -268,10 +273,20 @@ def validate_log_filename(filename: str, cmd_name: str, assume_yes: bool = False
     return log_fname
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_login() -> str:
     """
-    Check user uid and return user name
+    Check user uid and return user name, it never changes during a run so it's looked up just once
 
     :return str: user name
     """
-    return "root" if os.getuid() == 0 else os.getlogin()
+    uid = os.getuid()
+    if uid == 0:
+        return "root"
+
+    # The password database doesn't need a controlling terminal, unlike os.getlogin()
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        # uid with no passwd entry (e.g. containers)
+        return str(uid)
@@ -1,12 +1,15 @@
 import click
+import functools
 import time
 import datetime
 import tmanager.core.messages.messages as msg
 
 
+@functools.lru_cache(maxsize=1024)
 def time_to_ctime(posix_time: float) -> str:
     """
     Transform seconds since epoch time into human readable time.
+    Tools often share the same dates (e.g. install and last update), so results are cached.
 
     :param posix_time: seconds since epoch
     :return: human readable time
@@ -23,9 +26,11 @@ def now() -> float:
     return time.time()
 
 
+@functools.lru_cache(maxsize=32)
 def date_to_epoch(date_time: str) -> float:
     """
     Returns the 'epoch-time' equivalent of the date taken as a parameter.
+    Results are cached, strptime is slow.
 
     :param str date_time: date to convert in epoch. It MUST BE in dd-mm-yyyy format
     :return float: seconds to epoch
@@ -1,7 +1,6 @@
 import os
 import shutil
 import tmanager.core.messages.messages as msg
-from distutils.dir_util import copy_tree
 
 
 def get_home_env() -> str:
@@ -107,16 +106,25 @@ def move_file(src: str, dst: str, rm: bool = True) -> int:
 
     if os.path.isdir(src):
         try:
-            if src != dst:
-                copy_tree(src, dst)
-            else:
+            if src == dst:
                 return 3
 
+            # A plain rename is enough when dst doesn't exist yet and src is on the same file system
+            if rm and not os.path.exists(dst):
+                try:
+                    os.rename(src.rstrip("/"), dst.rstrip("/"))
+                    return 0
+                except OSError:
+                    pass
+
+            # Merge src into dst, file contents are copied by the kernel (sendfile) where available
+            shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=shutil.copy2)
+
             if rm:
                 delete_from_fs(src)  # delete src file
-        except FileExistsError:
-            msg.Prints.info("ERROR - The file {} already exists".format(dst), "", "", icon=False)
-            return 1
+        except (shutil.Error, OSError) as e:
+            msg.Prints.info("ERROR - Unable to copy {} into {}: {}".format(src, dst, e), "", "", icon=False)
+            return 2
     else:
         fname = get_file_name(src)
         try:
@@ -131,7 +139,7 @@ def move_file(src: str, dst: str, rm: bool = True) -> int:
 
 def zip_all(zipfh, path: str, rel: str = "") -> None:
     """
-    Recursively compress any file and directory
+    Compress any file and directory
     that is found under the pathname 'path'.
 
     :param zipfh: ZIP file handler
@@ -143,19 +151,20 @@ def zip_all(zipfh, path: str, rel: str = "") -> None:
     if os.path.isfile(path) and path.endswith(".tman"):
         zipfh.write(path, "conf.tman")
     elif os.path.isdir(path):
-        if rel == "":
-            rel = bname
-        zipfh.write(path, os.path.join(rel))
-        for root, dirs, files in os.walk(path):
-            for d in dirs:
-                zip_all(zipfh, os.path.join(root, d), os.path.join(rel, d))
-            for f in files:
-                zipfh.write(os.path.join(root, f), os.path.join(rel, f))
-            break
+        # Walk the tree with an explicit stack: scandir entries already know whether they are directories
+        stack = [(path, rel or bname)]
+        while stack:
+            dir_path, dir_rel = stack.pop()
+            zipfh.write(dir_path, dir_rel)
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    entry_rel = os.path.join(dir_rel, entry.name)
+                    if entry.is_dir():
+                        stack.append((entry.path, entry_rel))
+                    else:
+                        zipfh.write(entry.path, entry_rel)
     elif os.path.isfile(path):
         zipfh.write(path, os.path.join(rel, bname))
-    else:
-        pass
 
 
 def exists_pathname(pathname):